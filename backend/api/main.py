@@ -1,5 +1,7 @@
 import sys
 import logging
+import logging.handlers
+import queue
 import time
 import uuid
 from datetime import datetime
@@ -10,11 +12,20 @@ from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.responses import JSONResponse
 
-sys.path.append(str(Path(__file__).parent.parent))
+# Les launchers exportent PYTHONPATH=backend; repli pour un lancement direct sans PYTHONPATH.
+_BACKEND_DIR = str(Path(__file__).resolve().parent.parent)
+if _BACKEND_DIR not in sys.path:
+    sys.path.append(_BACKEND_DIR)
 
 from storage.activity_store import LocalTempStorage
 from registry.series_registry import SeriesRegistry
 
+from api import state as app_state
+from api.responses import ORJSONResponse
+
+
+logger = logging.getLogger("coursescope")
+
 
 class _DefaultRequestIdFilter(logging.Filter):
     def filter(self, record: logging.LogRecord) -> bool:  # pragma: no cover
@@ -23,7 +34,13 @@ class _DefaultRequestIdFilter(logging.Filter):
         return True
 
 
-def _configure_logging() -> logging.Logger:
+def _configure_logging() -> tuple[logging.handlers.QueueListener, logging.handlers.QueueHandler]:
+    """Configure le logger "coursescope".
+
+    Les handlers fichier/console sont alimentes par un QueueListener (thread dedie):
+    cote requete, un log se resume a un enqueue en memoire, sans I/O disque sur
+    la boucle d'evenements.
+    """
     repo_root = Path(__file__).resolve().parents[2]
     logs_dir = repo_root / "logs"
     logs_dir.mkdir(parents=True, exist_ok=True)
@@ -31,7 +48,6 @@ def _configure_logging() -> logging.Logger:
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_path = logs_dir / f"backend_{timestamp}.log"
 
-    logger = logging.getLogger("coursescope")
     logger.setLevel(logging.INFO)
     logger.propagate = False
 
@@ -53,25 +69,42 @@ def _configure_logging() -> logging.Logger:
     stream_handler.setFormatter(formatter)
     stream_handler.addFilter(_DefaultRequestIdFilter())
 
-    logger.addHandler(file_handler)
-    logger.addHandler(stream_handler)
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue,
+        file_handler,
+        stream_handler,
+        respect_handler_level=True,
+    )
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    logger.addHandler(queue_handler)
+    listener.start()
 
     logger.info("backend_start", extra={"request_id": "-"})
     logger.info("log_file=%s", str(log_path), extra={"request_id": "-"})
-    return logger
+    return listener, queue_handler
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    logger = _configure_logging()
+    log_listener, queue_handler = _configure_logging()
     storage = LocalTempStorage()
     registry = SeriesRegistry()
 
     app.state.storage = storage
     app.state.registry = registry
-    app.state.logger = logger
+    app_state.storage = storage
+    app_state.registry = registry
+    app.state.log_listener = log_listener
 
-    yield
+    try:
+        yield
+    finally:
+        # Detache le QueueHandler, vide la file puis ferme le fichier de log.
+        logger.removeHandler(queue_handler)
+        log_listener.stop()
+        for handler in log_listener.handlers:
+            handler.close()
 
 
 app = FastAPI(
@@ -79,12 +112,12 @@ app = FastAPI(
     description="Analytics pour traces GPX/FIT",
     version="1.1.53",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 
 @app.middleware("http")
 async def request_logging_middleware(request: Request, call_next):
-    logger: logging.Logger = request.app.state.logger
     request_id = str(uuid.uuid4())
     request.state.request_id = request_id
 
@@ -122,13 +155,19 @@ async def request_logging_middleware(request: Request, call_next):
     )
     return response
 
+# Listes explicites: evite l'expansion "*" de CORSMiddleware sur chaque preflight.
+_CORS_ORIGINS = ["http://localhost:3000", "http://localhost:3001"]
+_CORS_ORIGIN_REGEX = r"^https?://(localhost|127\.0\.0\.1)(:\d+)?$"
+_CORS_METHODS = ["GET", "POST", "DELETE", "OPTIONS"]
+_CORS_HEADERS = ["Content-Type", "Max-Size"]
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["http://localhost:3000", "http://localhost:3001"],
-    allow_origin_regex=r"^https?://(localhost|127\.0\.0\.1)(:\d+)?$",
+    allow_origins=_CORS_ORIGINS,
+    allow_origin_regex=_CORS_ORIGIN_REGEX,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=_CORS_METHODS,
+    allow_headers=_CORS_HEADERS,
 )
 
 from api.routes.activities import router as activities_router
@@ -149,11 +188,11 @@ app.include_router(maps_router, prefix="/api", include_in_schema=False)
 
 
 def get_activity_storage():
-    return app.state.storage
+    return app_state.storage
 
 
 def get_series_registry():
-    return app.state.registry
+    return app_state.registry
 
 
 @app.get("/")
@@ -170,7 +209,6 @@ async def root():
 async def health_check():
     """Health check endpoint"""
     try:
-        logger = logging.getLogger("coursescope")
         logger.info("health_check", extra={"request_id": "-"})
         storage = get_activity_storage()
         registry = get_series_registry()
@@ -183,7 +221,6 @@ async def health_check():
         logger.info("health_ok", extra={"request_id": "-"})
         return result
     except Exception as e:
-        logger = logging.getLogger("coursescope")
         logger.exception("health_failed", extra={"request_id": "-"})
         raise HTTPException(status_code=503, detail=f"Service unavailable: {str(e)}")
 
@@ -0,0 +1,25 @@
+"""Classes de reponse HTTP partagees par l'API."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from starlette.responses import JSONResponse
+
+from services.serialization import to_jsonable
+
+
+_ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _orjson_default(obj: Any) -> Any:
+    # Types non geres nativement par orjson (pd.Timestamp, NaT, DataFrame, dataclasses...).
+    return to_jsonable(obj)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse encodee avec orjson (numpy natif, NaN -> null)."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_orjson_default, option=_ORJSON_OPTIONS)
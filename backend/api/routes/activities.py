@@ -1,43 +1,38 @@
-from pathlib import Path
-
 import logging
 
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Header, Request
-from typing import Optional
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Header, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from pydantic import TypeAdapter
+from typing import Dict, List, Optional
 
-from api.schemas import ActivityLoadResponse, SidebarStats, ActivityLimits
+from api import state as app_state
+from api.responses import ORJSONResponse
+from api.schemas import ActivityLoadResponse, ActivityLimits, ActivityMetadata
 from services.analysis_service import load_activity
-from storage.activity_store import LocalTempStorage
 
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+logger = logging.getLogger("coursescope")
+
+# Serialise {"activities": [...]} en une seule passe pydantic-core (model_dump_json).
+_ACTIVITIES_LIST_ADAPTER = TypeAdapter(Dict[str, List[ActivityMetadata]])
 
+_ALLOWED_EXTS = frozenset({".gpx", ".fit"})
 
-def _get_logger(request: Request) -> logging.Logger:
-    return request.app.state.logger
+_LARGE_LIMIT = 10000
 
 
 def _get_request_id(request: Request) -> str:
     return getattr(getattr(request, "state", None), "request_id", "-")
 
 
-def get_activity_storage(request: Request) -> LocalTempStorage:
-    return request.app.state.storage
-
-
-def _model_to_dict(model):
-    if hasattr(model, "model_dump"):
-        return model.model_dump()
-    return model.dict()
-
-
 def check_dataframe_limits(df) -> ActivityLimits:
     original_points = len(df)
 
-    if original_points > 10000:
+    if original_points > _LARGE_LIMIT:
         return ActivityLimits(
             downsampled=True,
-            dataframe_limit=10000,
+            dataframe_limit=_LARGE_LIMIT,
             note=f"Large dataset ({original_points} points). Consider downsampling.",
         )
 
@@ -55,7 +50,6 @@ async def load_activity_endpoint(
     max_size: int = Header(100_000_000),
 ):
     """Charge une activité GPX/FIT et retourne son ID"""
-    logger = _get_logger(request)
     request_id = _get_request_id(request)
 
     logger.info(
@@ -70,35 +64,53 @@ async def load_activity_endpoint(
     if not file.filename:
         raise HTTPException(status_code=400, detail="Missing filename")
 
-    allowed_extensions = {".gpx", ".fit"}
-    if not any(file.filename.lower().endswith(ext) for ext in allowed_extensions):
+    # endswith plutot que Path.suffix: ".gpx" seul (dotfile) reste accepte.
+    lowered_filename = file.filename.lower()
+    suffix = next((ext for ext in _ALLOWED_EXTS if lowered_filename.endswith(ext)), None)
+    if suffix is None:
         raise HTTPException(
             status_code=400,
-            detail=f"Invalid file extension. Allowed: {', '.join(sorted(allowed_extensions))}",
+            detail=f"Invalid file extension. Allowed: {', '.join(sorted(_ALLOWED_EXTS))}",
         )
 
+    # Starlette a deja spoole le corps multipart: la taille est connue avant lecture,
+    # un fichier trop gros est rejete sans le charger en memoire.
+    file_size = file.size
+    if file_size is None:
+        file.file.seek(0, 2)
+        file_size = file.file.tell()
+        file.file.seek(0)
+    if file_size > max_size:
+        logger.info(
+            "upload_file_too_large",
+            extra={
+                "request_id": request_id,
+                "upload_filename": file.filename,
+                "size_bytes": file_size,
+                "max_size": max_size,
+            },
+        )
+        raise HTTPException(
+            status_code=413,
+            detail=f"File too large. Max size: {max_size / (1024 * 1024):.1f}MB",
+        )
     file_bytes = await file.read()
+
     logger.info(
         "upload_file_read",
         extra={
             "request_id": request_id,
             "upload_filename": file.filename,
-            "extension": Path(file.filename).suffix.lower(),
+            "extension": suffix,
             "size_bytes": len(file_bytes),
             "max_size": max_size,
         },
     )
-    if len(file_bytes) > max_size:
-        raise HTTPException(
-            status_code=413,
-            detail=f"File too large. Max size: {max_size / (1024 * 1024):.1f}MB",
-        )
 
     try:
         display_name = name or file.filename
-        suffix = Path(file.filename).suffix
         parse_name = display_name
-        if suffix and not display_name.lower().endswith(suffix.lower()):
+        if not display_name.lower().endswith(suffix):
             parse_name = f"{display_name}{suffix}"
 
         logger.info(
@@ -110,10 +122,18 @@ async def load_activity_endpoint(
                 "upload_filename": file.filename,
             },
         )
-        activity = load_activity(data=file_bytes, name=parse_name)
+        # Parsing GPX/FIT et ecriture disque: hors de la boucle d'evenements.
+        activity = await run_in_threadpool(load_activity, data=file_bytes, name=parse_name)
+        df = activity.df
+        if df is None:
+            raise RuntimeError("Loaded activity missing DataFrame")
 
-        storage = get_activity_storage(request)
-        activity_id = storage.store(activity, file.filename, file_bytes, name=display_name)
+        storage = app_state.storage
+        # Stats sidebar calculees une seule fois: reutilisees pour meta.json et la reponse.
+        stats = await run_in_threadpool(storage._compute_sidebar_stats, df)
+        activity_id = await run_in_threadpool(
+            storage.store, activity, file.filename, file_bytes, name=display_name, stats_sidebar=stats
+        )
 
         logger.info(
             "upload_store_ok",
@@ -123,10 +143,6 @@ async def load_activity_endpoint(
                 "activity_type": getattr(activity, "type", None),
             },
         )
-        df = activity.df
-        if df is None:
-            raise RuntimeError("Loaded activity missing DataFrame")
-        stats = storage._compute_sidebar_stats(df)
         limits = check_dataframe_limits(df)
 
         logger.info(
@@ -140,7 +156,7 @@ async def load_activity_endpoint(
         return ActivityLoadResponse(
             id=activity_id,
             type=activity.type,
-            stats_sidebar=SidebarStats(**_model_to_dict(stats)),
+            stats_sidebar=stats,
             limits=limits,
         )
     except ValueError as e:
@@ -170,21 +186,22 @@ async def load_activity_endpoint(
 
 
 @router.get("/activities")
-async def list_activities(request: Request):
+async def list_activities():
     """Liste toutes les activités stockées"""
     try:
-        storage = get_activity_storage(request)
+        storage = app_state.storage
         activities = storage.list_activities()
-        return {"activities": [_model_to_dict(activity) for activity in activities]}
+        content = _ACTIVITIES_LIST_ADAPTER.dump_json({"activities": activities})
+        return Response(content=content, media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to list activities: {str(e)}")
 
 
 @router.delete("/activity/{activity_id}")
-async def delete_activity(request: Request, activity_id: str):
+async def delete_activity(activity_id: str):
     """Supprime une activité"""
     try:
-        storage = get_activity_storage(request)
+        storage = app_state.storage
         success = storage.delete(activity_id)
 
         if not success:
@@ -199,10 +216,10 @@ async def delete_activity(request: Request, activity_id: str):
 
 
 @router.delete("/activities")
-async def cleanup_all_activities(request: Request):
+async def cleanup_all_activities():
     """Supprime toutes les activités (vidage)"""
     try:
-        storage = get_activity_storage(request)
+        storage = app_state.storage
         storage.cleanup_all()
         return {"message": "All activities cleaned up successfully"}
     except Exception as e:
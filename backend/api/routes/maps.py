@@ -1,26 +1,27 @@
-from fastapi import APIRouter, Query, HTTPException, Request
+from fastapi import APIRouter, Query, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from typing import Optional
-import pandas as pd
+import numpy as np
 
+from api import state as app_state
+from api.responses import ORJSONResponse
 from api.schemas import ActivityMapResponse, MapMarker
 
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 def calculate_bounds(df) -> list:
     """Calcule bounding box [minLon, minLat, maxLon, maxLat]"""
     if "lat" not in df.columns or "lon" not in df.columns:
-        return [0, 0, 0, 0]
+        return [0.0, 0.0, 0.0, 0.0]
 
-    valid_coords = df[["lat", "lon"]].dropna()
-    if valid_coords.empty:
-        return [0, 0, 0, 0]
+    coords = df[["lat", "lon"]].dropna().to_numpy(dtype=float)
+    if coords.size == 0:
+        return [0.0, 0.0, 0.0, 0.0]
 
-    min_lat = valid_coords["lat"].min()
-    max_lat = valid_coords["lat"].max()
-    min_lon = valid_coords["lon"].min()
-    max_lon = valid_coords["lon"].max()
+    min_lat, min_lon = coords.min(axis=0).tolist()
+    max_lat, max_lon = coords.max(axis=0).tolist()
 
     return [min_lon, min_lat, max_lon, max_lat]
 
@@ -30,75 +31,81 @@ def extract_polyline(df, downsample: Optional[int] = None) -> list:
     if "lat" not in df.columns or "lon" not in df.columns:
         return []
 
-    coords = df[["lat", "lon"]].dropna()
-    if coords.empty:
+    coords = df[["lat", "lon"]].to_numpy(dtype=float)
+    coords = coords[~np.isnan(coords).any(axis=1)]
+    if len(coords) == 0:
         return []
 
     if downsample and len(coords) > downsample:
         step = max(1, len(coords) // downsample)
-        coords = coords.iloc[::step]
+        coords = coords[::step]
 
-    return [[row["lat"], row["lon"]] for _, row in coords.iterrows()]
+    return coords.tolist()
 
 
 def extract_markers(df) -> list:
     """Extrait points remarquables (pauses, climbs, etc.)"""
     markers = []
 
-    if df.empty:
+    if df.index.size == 0:
         return markers
 
     if "speed_m_s" in df.columns and "lat" in df.columns and "lon" in df.columns:
-        pauses = df[df["speed_m_s"] < 0.1]
-        for _, pause in pauses.iterrows():
-            if not pd.isna(pause["lat"]) and not pd.isna(pause["lon"]):
+        speed = df["speed_m_s"].to_numpy(dtype=float)
+        lat = df["lat"].to_numpy(dtype=float)
+        lon = df["lon"].to_numpy(dtype=float)
+        pause_mask = (speed < 0.1) & ~np.isnan(lat) & ~np.isnan(lon)
+        # Un seul marqueur par pause: premier point de chaque sequence contigue.
+        starts = np.flatnonzero(np.diff(pause_mask.astype(np.int8), prepend=0) == 1)
+        markers.extend(
+            MapMarker(lat=pause_lat, lon=pause_lon, label="Pause", type="pause")
+            for pause_lat, pause_lon in zip(lat[starts].tolist(), lon[starts].tolist())
+        )
+
+    if "elevation" in df.columns and "lat" in df.columns and "lon" in df.columns:
+        elev = df["elevation"].to_numpy(dtype=np.float64)
+        if not np.isnan(elev).all():
+            i = int(np.nanargmax(elev))
+            lat_i = float(df["lat"].iat[i])
+            lon_i = float(df["lon"].iat[i])
+            if not (np.isnan(lat_i) or np.isnan(lon_i)):
                 markers.append(
                     MapMarker(
-                        lat=pause["lat"],
-                        lon=pause["lon"],
-                        label="Pause",
-                        type="pause",
+                        lat=lat_i,
+                        lon=lon_i,
+                        label=f"Max Alt: {elev[i]:.0f}m",
+                        type="elevation",
                     )
                 )
 
-    if "elevation" in df.columns and "lat" in df.columns and "lon" in df.columns:
-        max_elev_idx = df["elevation"].idxmax()
-        max_elev = df.loc[max_elev_idx]
-        if not pd.isna(max_elev["lat"]) and not pd.isna(max_elev["lon"]):
-            markers.append(
-                MapMarker(
-                    lat=max_elev["lat"],
-                    lon=max_elev["lon"],
-                    label=f"Max Alt: {max_elev['elevation']:.0f}m",
-                    type="elevation",
-                )
-            )
-
     return markers
 
 
-@router.get("/activity/{activity_id}/map", response_model=ActivityMapResponse)
+# Pas de response_model: la polyline (milliers de [lat, lon] issus de numpy) est encodee
+# directement par orjson, sans validation pydantic par flottant. Schema documente via `responses`.
+@router.get("/activity/{activity_id}/map", responses={200: {"model": ActivityMapResponse}})
 async def get_activity_map(
-    request: Request,
     activity_id: str,
     downsample: Optional[int] = Query(None, description="Max points after downsampling"),
 ):
     """Retourne les données cartographiques pour une activité"""
     try:
-        storage = request.app.state.storage
-        df = storage.load_dataframe(activity_id)
+        storage = app_state.storage
+        df = await run_in_threadpool(storage.load_dataframe, activity_id)
 
-        if df.empty:
+        if df.index.size == 0:
             raise HTTPException(status_code=404, detail=f"Activity {activity_id} not found")
 
         bbox = calculate_bounds(df)
         polyline = extract_polyline(df, downsample)
         markers = extract_markers(df)
 
-        return ActivityMapResponse(
-            bbox=bbox,
-            polyline=polyline,
-            markers=markers if markers else None,
+        return ORJSONResponse(
+            {
+                "bbox": bbox,
+                "polyline": polyline,
+                "markers": [marker.model_dump() for marker in markers] if markers else None,
+            }
         )
 
     except FileNotFoundError:
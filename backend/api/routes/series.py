@@ -1,11 +1,13 @@
-from fastapi import APIRouter, Query, HTTPException, Request
+from fastapi import APIRouter, Query, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from typing import Optional, Literal
 
+from api import state as app_state
+from api.responses import ORJSONResponse
 from api.schemas import SeriesResponse
-from registry.series_registry import SeriesRegistry
 
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 def _model_to_dict(model):
@@ -14,13 +16,8 @@ def _model_to_dict(model):
     return model.dict()
 
 
-def get_series_registry(request: Request) -> SeriesRegistry:
-    return request.app.state.registry
-
-
 @router.get("/activity/{activity_id}/series/{series_name}", response_model=SeriesResponse)
 async def get_series(
-    request: Request,
     activity_id: str,
     series_name: str,
     x_axis: Literal["time", "distance"] = Query("time", description="X axis type"),
@@ -30,14 +27,16 @@ async def get_series(
 ):
     """Retourne les données d'une série spécifique avec slicing et downsampling"""
     try:
-        storage = request.app.state.storage
-        df = storage.load_dataframe(activity_id)
+        storage = app_state.storage
+        df = await run_in_threadpool(storage.load_dataframe, activity_id)
 
-        if df.empty:
+        if df.index.size == 0:
             raise HTTPException(status_code=404, detail=f"Activity {activity_id} not found")
 
-        registry = get_series_registry(request)
-        series_response = registry.get_series_data(
+        registry = app_state.registry
+        # Slicing + downsampling pandas: hors de la boucle d'evenements.
+        series_response = await run_in_threadpool(
+            registry.get_series_data,
             df=df,
             name=series_name,
             x_axis=x_axis,
@@ -59,16 +58,16 @@ async def get_series(
 
 
 @router.get("/activity/{activity_id}/series")
-async def list_available_series(request: Request, activity_id: str):
+async def list_available_series(activity_id: str):
     """Liste toutes les séries disponibles pour une activité"""
     try:
-        storage = request.app.state.storage
-        df = storage.load_dataframe(activity_id)
+        storage = app_state.storage
+        df = await run_in_threadpool(storage.load_dataframe, activity_id)
 
-        if df.empty:
+        if df.index.size == 0:
             raise HTTPException(status_code=404, detail=f"Activity {activity_id} not found")
 
-        registry = get_series_registry(request)
+        registry = app_state.registry
         available_series = registry.get_available_series(df)
 
         return {
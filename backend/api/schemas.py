@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List, Literal
 from datetime import datetime
 
@@ -151,5 +151,8 @@ class ProPaceVsGradePoint(BaseModel):
 
 
 class PaceVsGradeResponse(BaseModel):
+    # Serialise directement via model_dump_json (NaN/inf -> null cote pydantic-core).
+    model_config = ConfigDict(ser_json_inf_nan="null")
+
     bins: List[PaceVsGradeBin]
     pro_ref: List[ProPaceVsGradePoint]
@@ -0,0 +1,17 @@
+"""Singletons applicatifs (storage, registry) renseignes par le lifespan.
+
+Les handlers lisent ces attributs de module directement plutot que la chaine
+`request.app.state.<attr>` a chaque requete.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from registry.series_registry import SeriesRegistry
+    from storage.activity_store import LocalTempStorage
+
+
+storage: Optional["LocalTempStorage"] = None
+registry: Optional["SeriesRegistry"] = None
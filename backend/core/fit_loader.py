@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import datetime
 import math
-from typing import IO, Any, Dict
+from typing import IO, Any, Dict, Sequence
 
 import numpy as np
 import pandas as pd
@@ -14,6 +14,8 @@ from core.contracts.activity_df_contract import COLUMNS
 
 
 SEMICIRCLE_TO_DEG = 180.0 / (2**31)
+# Meme rayon terrestre que gpxpy.geo.haversine_distance.
+_EARTH_DIAMETER_M = 2.0 * gpx_geo.EARTH_RADIUS
 
 
 def _patch_fitparse_datetime() -> None:
@@ -49,167 +51,245 @@ def _patch_fitparse_datetime() -> None:
 _patch_fitparse_datetime()
 
 
-def _build_field_lookup(record) -> dict[str, tuple[Any, str | None]]:
-    lookup: dict[str, tuple[Any, str | None]] = {}
-    try:
-        fields = getattr(record, "fields", None)
-    except Exception:
-        fields = None
-    if not fields:
-        return lookup
-    try:
-        for f in fields:
-            fname = getattr(f, "name", None)
-            if not fname:
-                continue
-            lookup[str(fname)] = (getattr(f, "value", None), getattr(f, "units", None))
-    except Exception:
-        return lookup
-    return lookup
+# FIT sans record: copie d'un gabarit construit une fois.
+_EMPTY_FRAME = pd.DataFrame(columns=COLUMNS)
+
+
+# Champs FIT consommes par fit_to_dataframe, chacun a une position fixe dans la ligne extraite.
+_RECORD_FIELDS: tuple[str, ...] = (
+    "position_lat",
+    "position_long",
+    "enhanced_altitude",
+    "altitude",
+    "timestamp",
+    "distance",
+    "enhanced_speed",
+    "speed",
+    "heart_rate",
+    "cadence",
+    "power",
+    "stride_length",
+    "enhanced_stride_length",
+    "vertical_oscillation",
+    "enhanced_vertical_oscillation",
+    "vertical_ratio",
+    "ground_contact_time",
+    "ground_contact_time_balance",
+)
+_FIELD_SLOT: dict[str, int] = {name: i for i, name in enumerate(_RECORD_FIELDS)}
+
+
+_EMPTY_ROW: tuple[None, ...] = (None,) * len(_RECORD_FIELDS)
+
+
+def _append_known_fields(record, values: list[Any], units: list[str | None]) -> None:
+    """Ajoute une ligne (ordre _RECORD_FIELDS, None si absent) aux tampons plats, en un seul parcours."""
+    base = len(values)
+    values.extend(_EMPTY_ROW)
+    units.extend(_EMPTY_ROW)
+    slot_of = _FIELD_SLOT.get
+    # record.fields est complet (champs de composants deja developpes par fitparse, champs
+    # developpeur inclus): un nom absent ici est absent du record, pas de repli get_value().
+    for f in record.fields:
+        slot = slot_of(f.name)
+        if slot is not None:
+            values[base + slot] = f.value
+            units[base + slot] = f.units
+
+
+# Unites FIT normalisees en code entier (une fois par unite distincte d'une colonne).
+_UNIT_UNKNOWN, _UNIT_M, _UNIT_CM, _UNIT_MM, _UNIT_S, _UNIT_MS, _UNIT_PCT = range(7)
+_UNIT_CODE: dict[str, int] = {
+    **dict.fromkeys(("m", "meter", "meters"), _UNIT_M),
+    **dict.fromkeys(("cm", "centimeter", "centimeters"), _UNIT_CM),
+    **dict.fromkeys(("mm", "millimeter", "millimeters"), _UNIT_MM),
+    **dict.fromkeys(("s", "sec", "second", "seconds"), _UNIT_S),
+    **dict.fromkeys(("ms", "millisecond", "milliseconds"), _UNIT_MS),
+}
+
+
+def _unit_code(units: str | None) -> int:
+    u = (units or "").lower()
+    code = _UNIT_CODE.get(u)
+    if code is not None:
+        return code
+    if "%" in u or "percent" in u:
+        return _UNIT_PCT
+    return _UNIT_UNKNOWN
 
 
-def _get_value(record, name: str, lookup: dict[str, tuple[Any, str | None]] | None) -> Any:
-    if lookup is not None and name in lookup:
-        return lookup[name][0]
-    try:
-        return record.get_value(name)
-    except Exception:
-        return None
-
-
-def _field_value_and_units(
-    record,
-    name: str,
-    *,
-    lookup: dict[str, tuple[Any, str | None]] | None = None,
-) -> tuple[float, str | None]:
-    """Retourne (valeur, unites) pour un champ FIT, converti en float si possible."""
-
-    raw = None
-    units = None
-    if lookup is not None and name in lookup:
-        raw, units = lookup[name]
-    else:
-        raw = _get_value(record, name, lookup)
-
-    if raw is None:
-        return math.nan, units
-    try:
-        return float(raw), units
-    except (TypeError, ValueError):
-        return math.nan, units
+def _unit_codes(units: Sequence[str | None]) -> np.ndarray:
+    """Code d'unite par ligne; la normalisation des chaines est faite par unite distincte."""
+    units_arr = np.asarray(units, dtype=object)
+    codes = np.full(len(units_arr), _UNIT_UNKNOWN, dtype=np.int8)
+    for u in set(units_arr.tolist()):
+        code = _unit_code(u)
+        if code != _UNIT_UNKNOWN:
+            codes[units_arr == u] = code
+    return codes
 
 
-def _convert_stride_length_m(value: float, units: str | None) -> float:
-    if not np.isfinite(value):
-        return math.nan
-    u = (units or "").lower()
-    if u in {"m", "meter", "meters"}:
-        return float(value)
-    if u in {"cm", "centimeter", "centimeters"}:
-        return float(value) / 100.0
+def _convert_stride_length_m(values: np.ndarray, codes: np.ndarray) -> np.ndarray:
     # Heuristique: des valeurs > 3 sont probablement en centimetres
-    if value > 3:
-        return float(value) / 100.0
-    return float(value)
+    to_cm = (codes != _UNIT_M) & ((codes == _UNIT_CM) | (values > 3))
+    out = np.where(to_cm, values / 100.0, values)
+    return np.where(np.isfinite(values), out, math.nan)
 
 
-def _convert_vertical_oscillation_cm(value: float, units: str | None) -> float:
-    if not np.isfinite(value):
-        return math.nan
-    u = (units or "").lower()
-    if u in {"cm", "centimeter", "centimeters"}:
-        return float(value)
-    if u in {"mm", "millimeter", "millimeters"}:
-        return float(value) / 10.0
-    if u in {"m", "meter", "meters"}:
-        return float(value) * 100.0
+def _convert_vertical_oscillation_cm(values: np.ndarray, codes: np.ndarray) -> np.ndarray:
+    is_mm = codes == _UNIT_MM
+    is_m = codes == _UNIT_M
+    unknown = ~(is_mm | is_m | (codes == _UNIT_CM))
     # Heuristique: VO typique ~5-15 cm; des grandes valeurs sont souvent en mm
-    if value > 40:
-        return float(value) / 10.0
-    if 0 < value < 1:
-        return float(value) * 100.0
-    return float(value)
+    from_mm = is_mm | (unknown & (values > 40))
+    from_m = is_m | (unknown & (values > 0) & (values < 1))
+    out = np.where(from_mm, values / 10.0, np.where(from_m, values * 100.0, values))
+    return np.where(np.isfinite(values), out, math.nan)
 
 
-def _convert_vertical_ratio_pct(value: float, units: str | None) -> float:
-    if not np.isfinite(value):
-        return math.nan
-    u = (units or "").lower()
-    if "%" in u or "percent" in u:
-        return float(value)
+def _to_percent(values: np.ndarray, codes: np.ndarray) -> np.ndarray:
+    """Vertical ratio / equilibre GCT en %."""
     # Heuristique: ratio 0-1 -> %
-    if 0 <= value <= 1.0:
-        return float(value) * 100.0
-    return float(value)
+    to_pct = (codes != _UNIT_PCT) & (values >= 0) & (values <= 1.0)
+    out = np.where(to_pct, values * 100.0, values)
+    return np.where(np.isfinite(values), out, math.nan)
 
 
-def _convert_ground_contact_time_ms(value: float, units: str | None) -> float:
-    if not np.isfinite(value):
-        return math.nan
-    u = (units or "").lower()
-    if u in {"ms", "millisecond", "milliseconds"}:
-        return float(value)
-    if u in {"s", "sec", "second", "seconds"}:
-        return float(value) * 1000.0
+def _convert_ground_contact_time_ms(values: np.ndarray, codes: np.ndarray) -> np.ndarray:
     # Heuristique: 0.2-0.4 secondes vs 200-400 ms
-    if value < 10:
-        return float(value) * 1000.0
-    return float(value)
+    from_s = (codes != _UNIT_MS) & ((codes == _UNIT_S) | (values < 10))
+    out = np.where(from_s, values * 1000.0, values)
+    return np.where(np.isfinite(values), out, math.nan)
 
 
-def _convert_gct_balance_pct(value: float, units: str | None) -> float:
-    if not np.isfinite(value):
-        return math.nan
-    u = (units or "").lower()
-    if "%" in u or "percent" in u:
-        return float(value)
-    if 0 <= value <= 1.0:
-        return float(value) * 100.0
-    return float(value)
-
-
-def _first_value_and_units(
-    record,
-    names: list[str],
-    *,
-    lookup: dict[str, tuple[Any, str | None]] | None = None,
-) -> tuple[float, str | None]:
+def _to_float_array(values: Sequence[Any]) -> np.ndarray:
+    """Liste de valeurs brutes FIT -> float64 (None / non numerique -> NaN)."""
+    try:
+        return np.array(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        out = np.full(len(values), math.nan)
+        for i, value in enumerate(values):
+            try:
+                out[i] = float(value)
+            except (TypeError, ValueError):
+                pass
+        return out
+
+
+def _to_sensor_array(values: Sequence[Any]) -> np.ndarray:
+    """Colonne capteur (hr, cadence, power): entiers gardes en int64, float64 + NaN si valeurs manquantes."""
+    if any(v is None for v in values):
+        return _to_float_array(values)
+    try:
+        return np.asarray(values)
+    except (TypeError, ValueError):
+        return _to_float_array(values)
+
+
+def _first_finite(
+    columns: dict[str, list[Any]],
+    units: dict[str, list[str | None]],
+    names: tuple[str, ...],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Par ligne, premiere valeur finie parmi names (ordre de priorite) et son code d'unite."""
+    values = np.full(len(columns[names[0]]), math.nan)
+    codes = np.full(len(values), _UNIT_UNKNOWN, dtype=np.int8)
     for name in names:
-        value, units = _field_value_and_units(record, name, lookup=lookup)
-        if np.isfinite(value):
-            return value, units
-    return math.nan, None
+        candidate = _to_float_array(columns[name])
+        take = np.isnan(values) & np.isfinite(candidate)
+        values[take] = candidate[take]
+        codes[take] = _unit_codes(units[name])[take]
+    return values, codes
 
 
-def _semicircle_to_deg(value: float | int | None) -> float:
-    if value is None:
-        return math.nan
-    try:
-        return float(value) * SEMICIRCLE_TO_DEG
-    except (TypeError, ValueError):
-        return math.nan
-
-
-def _distance_3d(
-    lat1: float | None,
-    lon1: float | None,
-    ele1: float | None,
-    lat2: float | None,
-    lon2: float | None,
-    ele2: float | None,
-) -> float:
-    if lat1 is None or lon1 is None or lat2 is None or lon2 is None:
-        return 0.0
-    if not (np.isfinite(lat1) and np.isfinite(lon1) and np.isfinite(lat2) and np.isfinite(lon2)):
-        return 0.0
-    dist_2d = gpx_geo.haversine_distance(lat1, lon1, lat2, lon2)
-    if ele1 is None or ele2 is None:
-        return dist_2d
-    if not (np.isfinite(ele1) and np.isfinite(ele2)):
-        return dist_2d
-    delta_elev = ele2 - ele1
-    return math.sqrt(dist_2d * dist_2d + delta_elev * delta_elev)
+def _prefer_present(primary: list[Any], fallback: list[Any]) -> list[Any]:
+    """Valeur primaire si presente (non None), sinon valeur de repli."""
+    return [p if p is not None else f for p, f in zip(primary, fallback)]
+
+
+def _distance_3d(lat: np.ndarray, lon: np.ndarray, ele: np.ndarray) -> np.ndarray:
+    """Distance 3D (haversine + denivele) entre points consecutifs, 0.0 pour le premier point.
+
+    Un segment sans position finie vaut 0.0; sans altitude finie, la distance 2D est conservee.
+    """
+    out = np.zeros(len(lat))
+    if len(lat) < 2:
+        return out
+
+    lat_r = np.radians(lat)
+    d_lat = lat_r[:-1] - lat_r[1:]
+    d_lon = np.radians(lon[:-1] - lon[1:])
+    a = np.sin(d_lat / 2) ** 2 + np.sin(d_lon / 2) ** 2 * np.cos(lat_r[:-1]) * np.cos(lat_r[1:])
+    dist_2d = _EARTH_DIAMETER_M * np.arcsin(np.sqrt(a))
+
+    delta_elev = ele[1:] - ele[:-1]
+    dist = np.where(np.isfinite(delta_elev), np.hypot(dist_2d, delta_elev), dist_2d)
+
+    valid = np.isfinite(lat[:-1]) & np.isfinite(lon[:-1]) & np.isfinite(lat[1:]) & np.isfinite(lon[1:])
+    out[1:] = np.where(valid, dist, 0.0)
+    return out
+
+
+def _cumulative_distance(
+    device_distance: np.ndarray,
+    lat: np.ndarray,
+    lon: np.ndarray,
+    ele: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Distance cumulee (m) et delta par point.
+
+    La distance du capteur est gardee tant qu'elle est finie et non decroissante;
+    sinon on cumule la distance geographique depuis le point precedent.
+    """
+    n = len(device_distance)
+    device_delta = np.diff(device_distance)
+    if np.isfinite(device_distance).all() and not (device_delta < 0).any():
+        # Cas courant: distance capteur complete et monotone, pas de haversine a calculer.
+        delta = np.empty(n)
+        delta[0] = 0.0
+        delta[1:] = device_delta
+        return device_distance, delta
+
+    geo_delta = _distance_3d(lat, lon, ele)
+    device_ok = np.isfinite(device_distance)
+
+    # Hypothese: tous les points capteur finis sont retenus. Les trous sont combles par la
+    # distance geo cumulee depuis le dernier point capteur (report via maximum.accumulate).
+    geo_only = np.where(device_ok, 0.0, geo_delta)
+    geo_cum = np.cumsum(geo_only)
+    idx = np.arange(n)
+    last_device = np.maximum.accumulate(np.where(device_ok, idx, -1))
+    has_device = last_device >= 0
+    anchor = last_device.clip(min=0)
+    distance = np.where(has_device, device_distance[anchor] + (geo_cum - geo_cum[anchor]), geo_cum)
+    if not (device_distance[1:][device_ok[1:]] < distance[:-1][device_ok[1:]]).any():
+        # Hypothese coherente (aucun point capteur sous la distance precedente): resultat exact.
+        delta = np.where(device_ok, 0.0, geo_delta)
+        delta[1:] = np.where(device_ok[1:], device_distance[1:] - distance[:-1], geo_delta[1:])
+        return distance, delta
+
+    # Cas residuel (distance capteur qui recule): recurrence point par point.
+    distance = np.empty(n)
+    delta = np.empty(n)
+    device = device_distance.tolist()
+    geo = geo_delta.tolist()
+    device_ok = device_ok.tolist()
+
+    cumulative = 0.0
+    prev = math.nan
+    for i in range(n):
+        d = device[i]
+        if not device_ok[i] or (i > 0 and d < prev):
+            dd = geo[i]
+            cumulative += dd
+            d = cumulative
+        else:
+            dd = 0.0 if i == 0 else d - prev
+            cumulative = d
+        distance[i] = d
+        delta[i] = dd
+        prev = d
+    return distance, delta
 
 
 def load_fit(file: IO[bytes]) -> FitFile:
@@ -221,135 +301,83 @@ def fit_to_dataframe(fitfile: FitFile) -> pd.DataFrame:
     """
     Transforme un FIT en DataFrame avec distances, temps et vitesses.
     """
-    rows = []
-    cumulative_distance = 0.0
-    start_time = None
-    prev_time = None
-    prev_lat = None
-    prev_lon = None
-    prev_ele = None
-    prev_distance = None
-
+    # Passe unique sur les records: valeurs brutes dans deux tampons plats (une ligne de
+    # len(_RECORD_FIELDS) cases par record, sans allocation par record), relues par colonne
+    # via slicing; les calculs (distances, temps, vitesses, unites) sont vectorises ensuite.
+    flat_values: list[Any] = []
+    flat_units: list[str | None] = []
     for record in fitfile.get_messages("record"):
-        lookup = _build_field_lookup(record)
-
-        lat_raw = _get_value(record, "position_lat", lookup)
-        lon_raw = _get_value(record, "position_long", lookup)
-        lat = _semicircle_to_deg(lat_raw)
-        lon = _semicircle_to_deg(lon_raw)
-
-        elev = _get_value(record, "enhanced_altitude", lookup)
-        if elev is None:
-            elev = _get_value(record, "altitude", lookup)
-
-        current_time = _get_value(record, "timestamp", lookup)
-        if start_time is None and current_time is not None:
-            start_time = current_time
-
-        if current_time is not None and prev_time is not None:
-            delta_time = (current_time - prev_time).total_seconds()
-        else:
-            delta_time = math.nan
-        if delta_time is not None and delta_time <= 0:
-            delta_time = math.nan
-
-        elapsed_time = (
-            (current_time - start_time).total_seconds()
-            if start_time is not None and current_time is not None
-            else math.nan
-        )
-
-        distance_m = _get_value(record, "distance", lookup)
-        use_geo = False
-        if distance_m is None or not np.isfinite(distance_m):
-            use_geo = True
-        elif prev_distance is not None and distance_m < prev_distance:
-            use_geo = True
-
-        if use_geo:
-            delta_distance = _distance_3d(prev_lat, prev_lon, prev_ele, lat, lon, elev)
-            if delta_distance is None or (isinstance(delta_distance, float) and math.isnan(delta_distance)):
-                delta_distance = 0.0
-            cumulative_distance += delta_distance
-            distance_m = cumulative_distance
-        else:
-            delta_distance = 0.0 if prev_distance is None else distance_m - prev_distance
-            cumulative_distance = float(distance_m)
-
-        speed_from_delta = False
-        speed_m_s = math.nan
-        if delta_time is not None and delta_time > 0 and delta_distance > 0:
-            speed_m_s = delta_distance / delta_time
-            speed_from_delta = True
-        if speed_m_s != speed_m_s:
-            speed_m_s = _get_value(record, "enhanced_speed", lookup)
-            if speed_m_s is None:
-                speed_m_s = _get_value(record, "speed", lookup)
-
-        if speed_from_delta and delta_distance < MIN_DISTANCE_FOR_SPEED_M:
-            speed_m_s = math.nan
-
-        if speed_m_s is None or not (MIN_SPEED_M_S <= speed_m_s <= MAX_SPEED_M_S):
-            speed_m_s = math.nan
-
-        pace_s_per_km = 1000.0 / speed_m_s if speed_m_s and speed_m_s > 0 else math.nan
-
-        stride_value, stride_units = _first_value_and_units(
-            record,
-            ["stride_length", "enhanced_stride_length"],
-            lookup=lookup,
-        )
-        stride_length_m = _convert_stride_length_m(stride_value, stride_units)
-
-        vo_value, vo_units = _first_value_and_units(
-            record,
-            ["vertical_oscillation", "enhanced_vertical_oscillation"],
-            lookup=lookup,
-        )
-        vertical_oscillation_cm = _convert_vertical_oscillation_cm(vo_value, vo_units)
-
-        vr_value, vr_units = _first_value_and_units(record, ["vertical_ratio"], lookup=lookup)
-        vertical_ratio_pct = _convert_vertical_ratio_pct(vr_value, vr_units)
-
-        gct_value, gct_units = _first_value_and_units(record, ["ground_contact_time"], lookup=lookup)
-        ground_contact_time_ms = _convert_ground_contact_time_ms(gct_value, gct_units)
-
-        gctb_value, gctb_units = _first_value_and_units(record, ["ground_contact_time_balance"], lookup=lookup)
-        gct_balance_pct = _convert_gct_balance_pct(gctb_value, gctb_units)
-
-        rows.append(
-            {
-                "lat": lat,
-                "lon": lon,
-                "elevation": elev,
-                "time": current_time,
-                "distance_m": distance_m,
-                "delta_distance_m": delta_distance,
-                "elapsed_time_s": elapsed_time,
-                "delta_time_s": delta_time,
-                "speed_m_s": speed_m_s,
-                "pace_s_per_km": pace_s_per_km,
-                "heart_rate": _get_value(record, "heart_rate", lookup),
-                "cadence": _get_value(record, "cadence", lookup),
-                "power": _get_value(record, "power", lookup),
-                "stride_length_m": stride_length_m,
-                "vertical_oscillation_cm": vertical_oscillation_cm,
-                "vertical_ratio_pct": vertical_ratio_pct,
-                "ground_contact_time_ms": ground_contact_time_ms,
-                "gct_balance_pct": gct_balance_pct,
-            }
-        )
-
-        prev_time = current_time
-        prev_lat = lat
-        prev_lon = lon
-        prev_ele = elev
-        prev_distance = distance_m
-
-    if not rows:
-        return pd.DataFrame(columns=COLUMNS)
-
-    return pd.DataFrame(rows, columns=COLUMNS)
+        _append_known_fields(record, flat_values, flat_units)
+
+    if not flat_values:
+        return _EMPTY_FRAME.copy()
+
+    width = len(_RECORD_FIELDS)
+    columns = {name: flat_values[i::width] for i, name in enumerate(_RECORD_FIELDS)}
+    column_units = {name: flat_units[i::width] for i, name in enumerate(_RECORD_FIELDS)}
+
+    col_lat = columns["position_lat"]
+    col_lon = columns["position_long"]
+    col_elev = _prefer_present(columns["enhanced_altitude"], columns["altitude"])
+    col_time = columns["timestamp"]
+    col_distance = columns["distance"]
+    col_speed = _prefer_present(columns["enhanced_speed"], columns["speed"])
+
+    stride = _first_finite(columns, column_units, ("stride_length", "enhanced_stride_length"))
+    vo = _first_finite(columns, column_units, ("vertical_oscillation", "enhanced_vertical_oscillation"))
+    vr = _first_finite(columns, column_units, ("vertical_ratio",))
+    gct = _first_finite(columns, column_units, ("ground_contact_time",))
+    gctb = _first_finite(columns, column_units, ("ground_contact_time_balance",))
+
+    lat = _to_float_array(col_lat) * SEMICIRCLE_TO_DEG
+    lon = _to_float_array(col_lon) * SEMICIRCLE_TO_DEG
+    elevation = _to_float_array(col_elev)
+
+    # Temps: arithmetique entiere en microsecondes (NaT -> NaN).
+    time = np.array(col_time, dtype="datetime64[us]")
+    time_us = time.astype(np.int64).astype(np.float64)
+    time_us[np.isnat(time)] = math.nan
+    delta_time = np.empty(len(time))
+    delta_time[0] = math.nan
+    delta_time[1:] = np.diff(time_us) / 1e6
+    delta_time[~(delta_time > 0)] = math.nan
+    valid_time = np.flatnonzero(~np.isnat(time))
+    start_us = time_us[valid_time[0]] if valid_time.size else math.nan
+    elapsed_time = (time_us - start_us) / 1e6
+
+    distance, delta_distance = _cumulative_distance(_to_float_array(col_distance), lat, lon, elevation)
+
+    # Vitesse: delta distance / delta temps, sinon vitesse capteur (enhanced_speed puis speed).
+    speed_from_delta = (delta_time > 0) & (delta_distance > 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        speed = np.where(speed_from_delta, delta_distance / delta_time, _to_float_array(col_speed))
+    speed[speed_from_delta & (delta_distance < MIN_DISTANCE_FOR_SPEED_M)] = math.nan
+    speed[~((speed >= MIN_SPEED_M_S) & (speed <= MAX_SPEED_M_S))] = math.nan
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pace = np.where(speed > 0, 1000.0 / speed, math.nan)
+
+    data = {
+        "lat": lat,
+        "lon": lon,
+        "elevation": elevation,
+        "time": time,
+        "distance_m": distance,
+        "delta_distance_m": delta_distance,
+        "elapsed_time_s": elapsed_time,
+        "delta_time_s": delta_time,
+        "speed_m_s": speed,
+        "pace_s_per_km": pace,
+        "heart_rate": _to_sensor_array(columns["heart_rate"]),
+        "cadence": _to_sensor_array(columns["cadence"]),
+        "power": _to_sensor_array(columns["power"]),
+        "stride_length_m": _convert_stride_length_m(*stride),
+        "vertical_oscillation_cm": _convert_vertical_oscillation_cm(*vo),
+        "vertical_ratio_pct": _to_percent(*vr),
+        "ground_contact_time_ms": _convert_ground_contact_time_ms(*gct),
+        "gct_balance_pct": _to_percent(*gctb),
+    }
+    # Colonnes deja typees: pas de copie a la construction.
+    return pd.DataFrame(data, columns=COLUMNS, copy=False)
 
 
 def detect_fit_type(df: pd.DataFrame) -> Dict[str, Any]:
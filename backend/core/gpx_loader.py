@@ -138,7 +138,7 @@ def gpx_to_dataframe(gpx: gpxpy.gpx.GPX) -> pd.DataFrame:
                     delta_time = (current_time - prev_time).total_seconds()
                 else:
                     delta_time = math.nan
-                if delta_time is not None and delta_time <= 0:
+                if not (delta_time > 0):
                     delta_time = math.nan
 
                 elapsed_time = (
@@ -148,7 +148,7 @@ def gpx_to_dataframe(gpx: gpxpy.gpx.GPX) -> pd.DataFrame:
                 )
 
                 speed_m_s = (
-                    delta_distance / delta_time if delta_time is not None and delta_time > 0 else math.nan
+                    delta_distance / delta_time if delta_time > 0 else math.nan
                 )
 
                 if delta_distance < MIN_DISTANCE_FOR_SPEED_M:
@@ -1,14 +1,14 @@
 from __future__ import annotations
 
 import math
+from functools import lru_cache
 from typing import Any, Dict
 
 import numpy as np
 import pandas as pd
 
 from core.constants import MIN_DISTANCE_FOR_SPEED_M
-from core.stats.basic_stats import compute_basic_stats
-from core.utils import seconds_to_mmss
+from core.stats.basic_stats import BasicStats, compute_basic_stats
 
 HR_ZONES = [
     ("Z1", 0.50, 0.60),
@@ -38,40 +38,126 @@ POWER_ZONES = [
 
 POWER_PEAK_DURATIONS_S = [5, 10, 30, 60, 120, 300, 600, 1200, 1800, 3600]
 
+# Cles du bloc "pacing", dans l'ordre des valeurs calculees par compute_garmin_like_stats.
+_PACING_KEYS = (
+    "pace_first_half_s_per_km",
+    "pace_second_half_s_per_km",
+    "pace_delta_s_per_km",
+    "drift_s_per_km_per_km",
+    "cardiac_drift_pct",
+    "cardiac_drift_slope_pct",
+    "stability_cv",
+    "stability_iqr_ratio",
+    "gap_residual_median_s",
+    "pace_threshold_s_per_km",
+)
+
+# Colonnes capteurs optionnelles lues par compute_garmin_like_stats.
+_SENSOR_COLUMNS = (
+    "heart_rate",
+    "cadence",
+    "power",
+    "stride_length_m",
+    "vertical_oscillation_cm",
+    "vertical_ratio_pct",
+    "ground_contact_time_ms",
+    "gct_balance_pct",
+)
+
+
+def _extract_float_columns(df: pd.DataFrame, names: tuple[str, ...]) -> dict[str, np.ndarray]:
+    """Conversion float unique des colonnes presentes et non entierement NaN.
+
+    La presence d'une cle remplace le test `df[name].notna().any()` (v == v est faux
+    seulement pour NaN, comme notna sur une colonne float).
+    """
+    cols = {}
+    for name in names:
+        if name in df:
+            values = df[name].to_numpy(dtype=float)
+            if (values == values).any():
+                cols[name] = values
+    return cols
+
 
 def _weighted_mean(values: np.ndarray, weights: np.ndarray) -> float:
     mask = np.isfinite(values) & np.isfinite(weights) & (weights > 0)
     if not mask.any():
         return math.nan
-    return float(np.nansum(values[mask] * weights[mask]) / np.nansum(weights[mask]))
+    # Valeurs selectionnees toutes finies: produit scalaire direct, sans nansum.
+    selected_weights = weights[mask]
+    return float(np.dot(values[mask], selected_weights) / selected_weights.sum())
 
 
-def _build_zone_table(
+@lru_cache(maxsize=8)
+def _zone_bins(zones: tuple[tuple[str, float, float], ...]) -> tuple[np.ndarray, tuple[tuple[int, int], ...]]:
+    """Bornes triees et plages de cases par zone, calculees une fois par definition de zones.
+
+    Un seul histogramme pondere sur les bornes triees; chaque zone [low, high)
+    (ou >= low si high infini) couvre une plage contigue de cases.
+    """
+    edges = np.array(sorted({low for _, low, _ in zones} | {h for _, _, h in zones if not math.isinf(h)}))
+    bounds = tuple(
+        (
+            int(np.searchsorted(edges, low)) + 1,
+            edges.size + 1 if math.isinf(high) else int(np.searchsorted(edges, high)) + 1,
+        )
+        for _, low, high in zones
+    )
+    return edges, bounds
+
+
+def _zone_times(
     ratios: np.ndarray,
     weights: np.ndarray,
     zones: list[tuple[str, float, float]],
-    label_func,
-) -> pd.DataFrame:
+) -> tuple[np.ndarray, float] | None:
+    """Temps par zone (ordre de `zones`) et temps total pondere, None si vide."""
     mask = np.isfinite(ratios) & np.isfinite(weights) & (weights > 0)
     if not mask.any():
-        return pd.DataFrame(columns=["zone", "range", "time_s", "time_pct"])
+        return None
     ratios = ratios[mask]
     weights = weights[mask]
     total_time = float(weights.sum())
     if total_time <= 0:
-        return pd.DataFrame(columns=["zone", "range", "time_s", "time_pct"])
+        return None
+
+    edges, bounds = _zone_bins(tuple(zones))
+    buckets = np.searchsorted(edges, ratios, side="right")
+    time_per_bucket = np.bincount(buckets, weights=weights, minlength=edges.size + 1)
+    times = np.array([time_per_bucket[start:stop].sum() for start, stop in bounds], dtype=float)
+    return times, total_time
+
+
+_ZONE_OPEN_LABEL = ">= {}{}".format
+_ZONE_RANGE_LABEL = "{}-{}{}".format
 
+
+@lru_cache(maxsize=8)
+def _zone_labels(zones: tuple[tuple[str, float, float], ...], suffix: str) -> tuple[str, ...]:
+    """Libelles "low-high<suffix>" (ou ">= low<suffix>") construits une fois par definition de zones."""
+    return tuple(
+        _ZONE_OPEN_LABEL(int(low * 100), suffix)
+        if math.isinf(high)
+        else _ZONE_RANGE_LABEL(int(low * 100), int(high * 100), suffix)
+        for _, low, high in zones
+    )
+
+
+def _zone_table(
+    zone_times: tuple[np.ndarray, float] | None,
+    zones: list[tuple[str, float, float]],
+    labels: tuple[str, ...],
+) -> pd.DataFrame:
+    if zone_times is None:
+        return pd.DataFrame(columns=["zone", "range", "time_s", "time_pct"])
+    times, total_time = zone_times
     rows = []
-    for name, low, high in zones:
-        if math.isinf(high):
-            zone_mask = ratios >= low
-        else:
-            zone_mask = (ratios >= low) & (ratios < high)
-        time_s = float(weights[zone_mask].sum())
+    for (name, _, _), label, time_s in zip(zones, labels, times.tolist()):
         rows.append(
             {
                 "zone": name,
-                "range": label_func(low, high),
+                "range": label,
                 "time_s": time_s,
                 "time_pct": (time_s / total_time) * 100.0,
             }
@@ -79,8 +165,17 @@ def _build_zone_table(
     return pd.DataFrame(rows)
 
 
-def _time_and_distance(df: pd.DataFrame) -> tuple[float, float]:
-    stats = compute_basic_stats(df)
+def _build_zone_table(
+    ratios: np.ndarray,
+    weights: np.ndarray,
+    zones: list[tuple[str, float, float]],
+    labels: tuple[str, ...],
+) -> pd.DataFrame:
+    return _zone_table(_zone_times(ratios, weights, zones), zones, labels)
+
+
+def _time_and_distance(df: pd.DataFrame, basic_stats: BasicStats | None = None) -> tuple[float, float]:
+    stats = basic_stats if basic_stats is not None else compute_basic_stats(df)
     return float(stats.total_time_s), float(stats.distance_m)
 
 
@@ -95,7 +190,7 @@ def _safe_percentile(values: np.ndarray, q: float) -> float:
     values = values[np.isfinite(values)]
     if values.size == 0:
         return math.nan
-    return float(np.nanpercentile(values, q))
+    return float(np.percentile(values, q))
 
 
 def _rolling_pace_s_per_km(
@@ -113,19 +208,30 @@ def _rolling_pace_s_per_km(
     dt = np.where(delta_time_s > 0, delta_time_s, 0.0)
     dd = np.where(delta_distance_m > 0, delta_distance_m, 0.0)
 
-    cum_t = np.concatenate(([0.0], np.cumsum(dt)))
-    cum_d = np.concatenate(([0.0], np.cumsum(dd)))
+    cum_t = np.zeros(n + 1, dtype=float)
+    np.cumsum(dt, out=cum_t[1:])
+    cum_d = np.zeros(n + 1, dtype=float)
+    np.cumsum(dd, out=cum_d[1:])
+
+    # cum_t est croissant: le debut de fenetre j de chaque point i est le dernier
+    # indice tel que end_t - cum_t[j] couvre encore window_s (j <= i).
+    end_t = cum_t[1:]
+    last = np.arange(n)
+    j = np.searchsorted(cum_t, end_t - window_s, side="right") - 1
+    np.clip(j, 0, last, out=j)
+    # searchsorted compare cum_t a end_t - window_s, arrondi differemment de
+    # end_t - cum_t[j]: on recale j sur ce test exact (decalage d'un indice au plus
+    # aux frontieres flottantes, ou sur une suite de dt nuls).
+    while (back := (j > 0) & (end_t - cum_t[j] < window_s)).any():
+        j[back] -= 1
+    while (ahead := (j < last) & (end_t - cum_t[np.minimum(j + 1, n)] >= window_s)).any():
+        j[ahead] += 1
+    time_win = end_t - cum_t[j]
+    dist_win = cum_d[1:] - cum_d[j]
 
     pace = np.full(n, np.nan, dtype=float)
-    j = 0
-    for i in range(n):
-        end_t = cum_t[i + 1]
-        while j < i and end_t - cum_t[j + 1] >= window_s:
-            j += 1
-        time_win = end_t - cum_t[j]
-        dist_win = cum_d[i + 1] - cum_d[j]
-        if time_win >= window_s and dist_win > 0:
-            pace[i] = time_win / (dist_win / 1000.0)
+    valid = (time_win >= window_s) & (dist_win > 0)
+    pace[valid] = time_win[valid] / (dist_win[valid] / 1000.0)
     return pace
 
 
@@ -159,6 +265,57 @@ def _robust_best_pace_s_per_km(
     return _safe_percentile(pace_roll, 1)
 
 
+def _centered_rolling_median(values: np.ndarray, *, window: int = 5) -> np.ndarray:
+    """Mediane glissante centree (fenetre impaire), NaN ignores.
+
+    Equivalent de `pd.Series(values).rolling(window, center=True, min_periods=1).median()`:
+    les fenetres sont tronquees aux bords et une fenetre sans valeur donne NaN.
+    """
+    values = np.asarray(values, dtype=float)
+    if values.size == 0:
+        return values.copy()
+    half = window // 2
+    padded = np.pad(values, half, constant_values=np.nan)
+    # Tri par ligne (NaN en fin): la mediane se lit aux rangs du milieu des valeurs presentes.
+    windows = np.sort(np.lib.stride_tricks.sliding_window_view(padded, window), axis=1)
+    counts = window - np.isnan(windows).sum(axis=1)
+    lo = np.take_along_axis(windows, np.maximum((counts - 1) // 2, 0)[:, None], axis=1)[:, 0]
+    hi = np.take_along_axis(windows, (counts // 2)[:, None], axis=1)[:, 0]
+    return (lo + hi) / 2.0
+
+
+def _gain_loss(diffs: np.ndarray, *, min_step_m: float = 0.0) -> tuple[float, float]:
+    """D+/D- d'une serie de differences d'altitude, pas |d| < min_step_m ignores.
+
+    Les sommes sont masquees (sans copie clip/where); un NaN se propage comme avant.
+    """
+    up = ~(diffs <= 0)
+    down = ~(diffs >= 0)
+    if min_step_m > 0:
+        kept = ~(np.abs(diffs) < min_step_m)
+        up &= kept
+        down &= kept
+    return float(np.sum(diffs, where=up)), float(np.abs(np.sum(diffs, where=down)))
+
+
+def _linear_slope(x: np.ndarray, y: np.ndarray, w: np.ndarray | None = None) -> float:
+    """Pente des moindres carres, forme fermee de np.polyfit(x, y, 1, w=w)[0].
+
+    Comme polyfit, `w` pondere les residus (poids effectifs w**2).
+    """
+    ww = np.ones_like(x) if w is None else w * w
+    total = float(ww.sum())
+    if total <= 0:
+        return math.nan
+    xc = x - np.dot(ww, x) / total
+    yc = y - np.dot(ww, y) / total
+    wxc = ww * xc
+    denom = float(np.dot(wxc, xc))
+    if denom <= 0:
+        return math.nan
+    return float(np.dot(wxc, yc) / denom)
+
+
 def _compute_grade_percent_from_elevation(
     elevation_m: np.ndarray, delta_distance_m: np.ndarray
 ) -> np.ndarray:
@@ -184,8 +341,8 @@ def _normalized_power_w(
     if power_w.size == 0:
         return math.nan
 
-    series_1hz = _resample_series_1hz(power_w, delta_time_s, mask)
-    return _normalized_power_from_series(series_1hz, rolling_window_s=rolling_window_s)
+    values_1hz = _resample_series_1hz(power_w, delta_time_s, mask)
+    return _normalized_power_from_series(values_1hz, rolling_window_s=rolling_window_s)
 
 
 def _resample_series_1hz(
@@ -194,38 +351,69 @@ def _resample_series_1hz(
     mask: np.ndarray,
     *,
     ffill_limit: int = 5,
-) -> pd.Series:
+) -> np.ndarray:
+    """Moyenne par seconde de temps en mouvement, trous combles sur `ffill_limit` secondes.
+
+    Equivalent NumPy de `resample("1s").mean().ffill(limit=ffill_limit)` sur un index
+    de temps ecoule (les cases de 1 s partent du premier point valide).
+    """
     dt = np.where(delta_time_s > 0, delta_time_s, 0.0)
     dt = np.where(mask, dt, 0.0)
     elapsed_s = np.cumsum(dt)
 
     valid = mask & (dt > 0) & np.isfinite(values)
     if int(valid.sum()) < 2:
-        return pd.Series(dtype=float)
+        return np.array([], dtype=float)
+
+    # elapsed_s est strictement croissant sur les points valides (dt > 0).
+    # Binning en nanosecondes entieres, comme un TimedeltaIndex.
+    ns = np.round(elapsed_s[valid] * 1e9).astype(np.int64)
+    bins = (ns - ns[0]) // 1_000_000_000
+    sums = np.bincount(bins, weights=values[valid])
+    counts = np.bincount(bins)
+    out = np.full(sums.size, np.nan, dtype=float)
+    np.divide(sums, counts, out=out, where=counts > 0)
+
+    # ffill limite: indice de la derniere seconde renseignee, propage vers l'avant.
+    positions = np.arange(out.size)
+    last = np.maximum.accumulate(np.where(counts > 0, positions, 0))
+    fill = (counts == 0) & (positions - last <= ffill_limit)
+    out[fill] = out[last[fill]]
+    return out
+
 
-    idx = pd.to_timedelta(elapsed_s[valid], unit="s")
-    s = pd.Series(values[valid], index=idx).sort_index()
-    if s.empty:
-        return pd.Series(dtype=float)
+def _prefix_sums(values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Sommes cumulees (NaN -> 0) et comptes de valeurs finies, prefixees par 0."""
+    finite = np.isfinite(values)
+    sums = np.zeros(values.size + 1, dtype=float)
+    np.cumsum(np.where(finite, values, 0.0), out=sums[1:])
+    counts = np.zeros(values.size + 1, dtype=np.int64)
+    np.cumsum(finite, out=counts[1:])
+    return sums, counts
 
-    s = s.groupby(level=0).mean()
-    return s.resample("1s").mean().ffill(limit=ffill_limit)
+
+def _full_window_means(sums: np.ndarray, counts: np.ndarray, window: int) -> np.ndarray:
+    """Moyennes glissantes des fenetres completes (equivalent rolling(min_periods=window).mean().dropna())."""
+    if window > sums.size - 1:
+        return np.array([], dtype=float)
+    complete = (counts[window:] - counts[:-window]) == window
+    return (sums[window:][complete] - sums[:-window][complete]) / window
 
 
 def _normalized_power_from_series(
-    series_1hz: pd.Series, *, rolling_window_s: int = 30
+    values_1hz: np.ndarray, *, rolling_window_s: int = 30
 ) -> float:
-    if series_1hz is None or series_1hz.empty:
+    if values_1hz is None or values_1hz.size == 0:
         return math.nan
 
-    if int(series_1hz.dropna().shape[0]) < rolling_window_s:
+    sums, counts = _prefix_sums(values_1hz)
+    if int(counts[-1]) < rolling_window_s:
         return math.nan
 
-    roll = series_1hz.rolling(window=rolling_window_s, min_periods=rolling_window_s).mean().dropna()
-    if roll.empty:
+    values = _full_window_means(sums, counts, rolling_window_s)
+    if values.size == 0:
         return math.nan
 
-    values = roll.to_numpy(dtype=float)
     mean_fourth = float(np.mean(np.power(values, 4)))
     if not np.isfinite(mean_fourth) or mean_fourth <= 0:
         return math.nan
@@ -233,18 +421,20 @@ def _normalized_power_from_series(
 
 
 def _compute_power_duration_curve_from_series(
-    series_1hz: pd.Series, durations_s: list[int]
+    values_1hz: np.ndarray, durations_s: list[int]
 ) -> list[dict[str, float]]:
-    if series_1hz is None or series_1hz.empty:
+    if values_1hz is None or values_1hz.size == 0:
         return []
 
+    # Une seule paire de sommes cumulees partagee par toutes les durees.
+    sums, counts = _prefix_sums(values_1hz)
     out: list[dict[str, float]] = []
     for duration in durations_s:
         window = int(duration)
         if window <= 0:
             continue
-        roll = series_1hz.rolling(window=window, min_periods=window).mean().dropna()
-        peak = float(roll.max()) if not roll.empty else math.nan
+        means = _full_window_means(sums, counts, window)
+        peak = float(means.max()) if means.size else math.nan
         out.append({"duration_s": float(window), "power_w": float(peak)})
     return out
 
@@ -255,35 +445,27 @@ def _compute_power_duration_curve(
     mask: np.ndarray,
     durations_s: list[int],
 ) -> list[dict[str, float]]:
-    series_1hz = _resample_series_1hz(power_w, delta_time_s, mask)
-    return _compute_power_duration_curve_from_series(series_1hz, durations_s)
+    values_1hz = _resample_series_1hz(power_w, delta_time_s, mask)
+    return _compute_power_duration_curve_from_series(values_1hz, durations_s)
 
 
-def _edwards_trimp_from_zones(zones_df: pd.DataFrame) -> float:
-    if zones_df is None or zones_df.empty:
-        return math.nan
-    if "zone" not in zones_df.columns or "time_s" not in zones_df.columns:
-        return math.nan
-
-    weights_map = {"Z1": 1, "Z2": 2, "Z3": 3, "Z4": 4, "Z5": 5}
-    weights = zones_df["zone"].map(weights_map).to_numpy(dtype=float)
-    time_s = pd.to_numeric(zones_df["time_s"], errors="coerce").to_numpy(dtype=float)
-    mask = np.isfinite(time_s) & np.isfinite(weights) & (weights > 0)
-    if not mask.any():
-        return math.nan
-    return float(np.nansum((time_s[mask] / 60.0) * weights[mask]))
+def _edwards_trimp(hr_zone_times_s: np.ndarray) -> float:
+    """TRIMP d'Edwards depuis les temps des zones HR_ZONES (poids 1..5 dans l'ordre)."""
+    return float(np.dot(hr_zone_times_s / 60.0, np.arange(1, hr_zone_times_s.size + 1, dtype=float)))
 
 
 def _negative_split(
-    delta_time_s: np.ndarray, delta_distance_m: np.ndarray, mask: np.ndarray
+    dt: np.ndarray, dist: np.ndarray, ratio: np.ndarray
 ) -> tuple[float, float, float]:
-    dist = delta_distance_m * mask
-    dt = delta_time_s * mask
+    """Allures des deux moities de distance.
+
+    `dt`/`dist` sont deja masques et `ratio` vaut _half_overlap_ratio(dist), partage
+    avec le calcul de derive cardiaque.
+    """
     total_dist = float(dist.sum())
     if total_dist <= 0:
         return math.nan, math.nan, math.nan
 
-    ratio = _half_overlap_ratio(dist)
     time_first = float(np.sum(dt * ratio))
     dist_first = float(np.sum(dist * ratio))
     time_second = float(dt.sum() - time_first)
@@ -298,28 +480,27 @@ def _half_overlap_ratio(dist: np.ndarray) -> np.ndarray:
     total_dist = float(dist.sum())
     if total_dist <= 0:
         return np.zeros_like(dist, dtype=float)
-    cum_dist = np.cumsum(dist)
+    # Un seul tableau cumule: cum[1:] (distance en fin de segment), cum[:-1] (debut).
+    cum = np.zeros(dist.size + 1, dtype=float)
+    np.cumsum(dist, out=cum[1:])
     half = total_dist / 2.0
-    prev = np.concatenate(([0.0], cum_dist[:-1]))
-    overlap = np.clip(np.minimum(cum_dist, half) - prev, 0.0, dist)
+    overlap = np.clip(np.minimum(cum[1:], half) - cum[:-1], 0.0, dist)
     ratio = np.zeros_like(dist, dtype=float)
     np.divide(overlap, dist, out=ratio, where=dist > 0)
     return ratio
 
 
 def compute_longest_pause(delta_time_s: np.ndarray, moving_mask: np.ndarray) -> float:
-    longest = 0.0
-    current = 0.0
-    for dt, moving in zip(delta_time_s, moving_mask):
-        if not moving and dt > 0:
-            current += float(dt)
-        else:
-            if current > longest:
-                longest = current
-            current = 0.0
-    if current > longest:
-        longest = current
-    return float(longest)
+    dt = np.asarray(delta_time_s, dtype=float)
+    paused = ~np.asarray(moving_mask, dtype=bool) & (dt > 0)
+    if not paused.any():
+        return 0.0
+    # Un identifiant par sequence de pause consecutive (0 hors pause), puis somme par sequence.
+    starts = paused.copy()
+    starts[1:] &= ~paused[:-1]
+    run_ids = np.cumsum(starts) * paused
+    totals = np.bincount(run_ids, weights=np.where(paused, dt, 0.0))
+    return float(totals[1:].max())
 
 
 def estimate_zone_inputs(df: pd.DataFrame, moving_mask: pd.Series) -> Dict[str, Any]:
@@ -328,28 +509,30 @@ def estimate_zone_inputs(df: pd.DataFrame, moving_mask: pd.Series) -> Dict[str,
     delta_time = df["delta_time_s"].fillna(0).to_numpy() if "delta_time_s" in df else np.zeros(len(df))
     delta_time = np.where(delta_time > 0, delta_time, 0.0)
 
-    if "heart_rate" in df and df["heart_rate"].notna().any():
-        hr = df["heart_rate"].to_numpy(dtype=float)
+    cols = _extract_float_columns(df, ("heart_rate", "cadence", "power"))
+
+    if "heart_rate" in cols:
+        hr = cols["heart_rate"]
         hr_mask = np.isfinite(hr) & (delta_time > 0) & mask
-        values["hr_max"] = float(np.nanmax(hr[hr_mask])) if hr_mask.any() else math.nan
+        values["hr_max"] = float(np.max(hr[hr_mask])) if hr_mask.any() else math.nan
         values["hr_available"] = True
     else:
         values["hr_max"] = math.nan
         values["hr_available"] = False
 
-    if "cadence" in df and df["cadence"].notna().any():
+    if "cadence" in cols:
         values["cadence_available"] = True
         values["cadence_target"] = 170.0
     else:
         values["cadence_available"] = False
         values["cadence_target"] = math.nan
 
-    if "power" in df and df["power"].notna().any():
-        power = df["power"].to_numpy(dtype=float)
+    if "power" in cols:
+        power = cols["power"]
         power_mask = np.isfinite(power) & (delta_time > 0) & mask
         values["power_available"] = True
         values["ftp_estimated"] = True
-        values["ftp_w"] = float(np.nanpercentile(power[power_mask], 95)) if power_mask.any() else math.nan
+        values["ftp_w"] = float(np.percentile(power[power_mask], 95)) if power_mask.any() else math.nan
     else:
         values["power_available"] = False
         values["ftp_estimated"] = False
@@ -360,7 +543,7 @@ def estimate_zone_inputs(df: pd.DataFrame, moving_mask: pd.Series) -> Dict[str,
         delta_dist = np.where(delta_dist > 0, delta_dist, 0.0)
         pace = _pace_from_deltas(delta_time, delta_dist)
         pace_mask = np.isfinite(pace) & (delta_time > 0) & mask
-        values["pace_threshold_s_per_km"] = float(np.nanmedian(pace[pace_mask])) if pace_mask.any() else math.nan
+        values["pace_threshold_s_per_km"] = float(np.median(pace[pace_mask])) if pace_mask.any() else math.nan
     else:
         values["pace_threshold_s_per_km"] = math.nan
 
@@ -379,7 +562,13 @@ def compute_garmin_like_stats(
     ftp_w: float | None = None,
     cadence_target: float | None = None,
     use_moving_time: bool = True,
+    basic_stats: BasicStats | None = None,
 ) -> Dict[str, Any]:
+    """Statistiques detaillees facon Garmin.
+
+    `basic_stats` permet de reutiliser un compute_basic_stats(df) deja calcule par
+    l'appelant (seules la duree totale et la distance sont lues).
+    """
     if df.empty:
         return {
             "summary": {},
@@ -393,7 +582,7 @@ def compute_garmin_like_stats(
             "pacing": {},
         }
 
-    total_time_s, total_distance_m = _time_and_distance(df)
+    total_time_s, total_distance_m = _time_and_distance(df, basic_stats)
 
     delta_time = df["delta_time_s"].fillna(0).to_numpy() if "delta_time_s" in df else np.zeros(len(df))
     delta_time = np.where(delta_time > 0, delta_time, 0.0)
@@ -405,12 +594,17 @@ def compute_garmin_like_stats(
 
     weights = delta_time * mask
     moving_time_s = float(weights.sum())
-    moving_distance_m = float((delta_dist * mask).sum())
+    # Vues masquees partagees par les sections ci-dessous.
+    dist_masked = delta_dist * mask
+    has_weight = weights > 0
+    cum_dist_km = np.cumsum(dist_masked) / 1000.0
+    moving_distance_m = float(dist_masked.sum())
     pause_time_s = float(max(total_time_s - moving_time_s, 0.0))
+    cols = _extract_float_columns(df, _SENSOR_COLUMNS)
 
     pace = _pace_from_deltas(delta_time, delta_dist)
     pace = np.where(mask, pace, np.nan)
-    pace_mask = np.isfinite(pace) & (weights > 0)
+    pace_mask = np.isfinite(pace) & has_weight
 
     speed_m_s = np.full_like(delta_time, np.nan, dtype=float)
     valid_speed = (delta_time > 0) & (delta_dist >= MIN_DISTANCE_FOR_SPEED_M) & mask
@@ -439,58 +633,52 @@ def compute_garmin_like_stats(
     elevation_max_m = math.nan
     if "elevation" in df:
         elevation = df["elevation"].ffill().bfill().to_numpy(dtype=float)
-        if np.isfinite(elevation).any():
-            elevation_min_m = float(np.nanmin(elevation))
-            elevation_max_m = float(np.nanmax(elevation))
+        # Apres ffill/bfill la serie est soit complete soit entierement NaN:
+        # le premier point suffit comme garde et min/max n'ont pas de NaN a ignorer.
+        if elevation.size and elevation[0] == elevation[0]:
+            elevation_min_m = float(elevation.min())
+            elevation_max_m = float(elevation.max())
         if len(elevation) > 1:
-            diffs = np.diff(elevation)
-            elevation_gain_m = float(np.clip(diffs, 0, None).sum())
-            elevation_loss_m = float(np.abs(np.clip(diffs, None, 0)).sum())
-
-            elev_smoothed = (
-                pd.Series(elevation)
-                .rolling(window=5, center=True, min_periods=1)
-                .median()
-                .to_numpy(dtype=float)
+            elevation_gain_m, elevation_loss_m = _gain_loss(np.diff(elevation))
+
+            elev_smoothed = _centered_rolling_median(elevation, window=5)
+            elevation_gain_filtered_m, elevation_loss_filtered_m = _gain_loss(
+                np.diff(elev_smoothed), min_step_m=0.5
             )
-            diffs_s = np.diff(elev_smoothed)
-            diffs_s = np.where(np.abs(diffs_s) < 0.5, 0.0, diffs_s)
-            elevation_gain_filtered_m = float(np.clip(diffs_s, 0, None).sum())
-            elevation_loss_filtered_m = float(np.abs(np.clip(diffs_s, None, 0)).sum())
 
-    pace_median = float(np.nanmedian(pace[pace_mask])) if pace_mask.any() else math.nan
-    pace_p10 = float(np.nanpercentile(pace[pace_mask], 10)) if pace_mask.any() else math.nan
-    pace_p90 = float(np.nanpercentile(pace[pace_mask], 90)) if pace_mask.any() else math.nan
+    # pace_mask ne garde que des allures finies: un seul appel percentile suffit.
+    pace_vals = pace[pace_mask]
+    pace_p10 = pace_q1 = pace_median = pace_q3 = pace_p90 = math.nan
+    if pace_vals.size:
+        pace_p10, pace_q1, pace_median, pace_q3, pace_p90 = (
+            float(v) for v in np.percentile(pace_vals, [10, 25, 50, 75, 90])
+        )
 
-    pace_first, pace_second, pace_delta = _negative_split(delta_time, delta_dist, mask)
+    ratio_first = _half_overlap_ratio(dist_masked)
+    pace_first, pace_second, pace_delta = _negative_split(weights, dist_masked, ratio_first)
 
     drift = math.nan
     if pace_mask.sum() >= 2:
-        cum_dist = np.cumsum(delta_dist * mask) / 1000.0
-        x = cum_dist[pace_mask]
-        y = pace[pace_mask]
-        if len(x) >= 2 and np.nanmax(x) > 0:
-            drift = float(np.polyfit(x, y, 1)[0])
+        x = cum_dist_km[pace_mask]
+        # cum_dist_km est croissant: x[-1] est le max.
+        if len(x) >= 2 and x[-1] > 0:
+            drift = _linear_slope(x, pace_vals)
 
     stability_cv = math.nan
     stability_iqr = math.nan
-    if pace_mask.any():
-        pace_vals = pace[pace_mask]
-        mean = float(np.nanmean(pace_vals))
-        median = float(np.nanmedian(pace_vals))
+    if pace_vals.size:
+        mean = float(np.mean(pace_vals))
         if mean > 0:
-            stability_cv = float(np.nanstd(pace_vals) / mean)
-        q1 = float(np.nanpercentile(pace_vals, 25))
-        q3 = float(np.nanpercentile(pace_vals, 75))
-        if median > 0:
-            stability_iqr = float((q3 - q1) / median)
+            stability_cv = float(np.std(pace_vals) / mean)
+        if pace_median > 0:
+            stability_iqr = float((pace_q3 - pace_q1) / pace_median)
 
     gap_residual = math.nan
     if gap_series is not None:
         gap_values = gap_series.to_numpy(dtype=float)
         mask_gap = pace_mask & np.isfinite(gap_values)
         if mask_gap.any():
-            gap_residual = float(np.nanmedian(pace[mask_gap] - gap_values[mask_gap]))
+            gap_residual = float(np.median(pace[mask_gap] - gap_values[mask_gap]))
 
     vam_m_h = elevation_gain_m / (moving_time_s / 3600.0) if moving_time_s > 0 else math.nan
 
@@ -499,17 +687,12 @@ def compute_garmin_like_stats(
         grade_values = grade_series.to_numpy(dtype=float)
     elif elevation is not None:
         grade_values = _compute_grade_percent_from_elevation(elevation, delta_dist)
-        grade_values = (
-            pd.Series(grade_values)
-            .rolling(window=5, center=True, min_periods=1)
-            .median()
-            .to_numpy(dtype=float)
-        )
+        grade_values = _centered_rolling_median(grade_values, window=5)
     else:
         grade_values = np.full(len(df), np.nan, dtype=float)
 
     grade_values = np.where(mask, grade_values, np.nan)
-    grade_weights = delta_dist * mask
+    grade_weights = dist_masked
     grade_mean_pct = _weighted_mean(grade_values, grade_weights)
     grade_clip = np.clip(grade_values, -30.0, 30.0)
     grade_valid = np.isfinite(grade_clip) & (grade_weights > 0)
@@ -518,9 +701,9 @@ def compute_garmin_like_stats(
 
     steps_total = math.nan
     step_length_est_m = math.nan
-    if "cadence" in df and df["cadence"].notna().any():
-        cad_values = df["cadence"].to_numpy(dtype=float)
-        cad_valid = np.isfinite(cad_values) & (weights > 0) & (cad_values > 0)
+    if "cadence" in cols:
+        cad_values = cols["cadence"]
+        cad_valid = np.isfinite(cad_values) & has_weight & (cad_values > 0)
         if cad_valid.any():
             steps_total = float(np.nansum(cad_values[cad_valid] * weights[cad_valid] / 60.0))
             step_len = np.full_like(cad_values, np.nan, dtype=float)
@@ -535,16 +718,16 @@ def compute_garmin_like_stats(
     ground_contact_time_mean_ms = math.nan
     gct_balance_mean_pct = math.nan
 
-    if "stride_length_m" in df and df["stride_length_m"].notna().any():
-        stride_length_mean_m = _weighted_mean(df["stride_length_m"].to_numpy(dtype=float), weights)
+    if "stride_length_m" in cols:
+        stride_length_mean_m = _weighted_mean(cols["stride_length_m"], weights)
     if stride_length_mean_m != stride_length_mean_m and step_length_est_m == step_length_est_m:
         stride_length_mean_m = float(step_length_est_m)
 
-    if "vertical_oscillation_cm" in df and df["vertical_oscillation_cm"].notna().any():
-        vertical_oscillation_mean_cm = _weighted_mean(df["vertical_oscillation_cm"].to_numpy(dtype=float), weights)
+    if "vertical_oscillation_cm" in cols:
+        vertical_oscillation_mean_cm = _weighted_mean(cols["vertical_oscillation_cm"], weights)
 
-    if "vertical_ratio_pct" in df and df["vertical_ratio_pct"].notna().any():
-        vertical_ratio_mean_pct = _weighted_mean(df["vertical_ratio_pct"].to_numpy(dtype=float), weights)
+    if "vertical_ratio_pct" in cols:
+        vertical_ratio_mean_pct = _weighted_mean(cols["vertical_ratio_pct"], weights)
     elif (
         vertical_oscillation_mean_cm == vertical_oscillation_mean_cm
         and stride_length_mean_m == stride_length_mean_m
@@ -553,11 +736,11 @@ def compute_garmin_like_stats(
         # vertical_ratio_pct ~= vertical_oscillation_cm / stride_length_m
         vertical_ratio_mean_pct = float(vertical_oscillation_mean_cm / stride_length_mean_m)
 
-    if "ground_contact_time_ms" in df and df["ground_contact_time_ms"].notna().any():
-        ground_contact_time_mean_ms = _weighted_mean(df["ground_contact_time_ms"].to_numpy(dtype=float), weights)
+    if "ground_contact_time_ms" in cols:
+        ground_contact_time_mean_ms = _weighted_mean(cols["ground_contact_time_ms"], weights)
 
-    if "gct_balance_pct" in df and df["gct_balance_pct"].notna().any():
-        gct_balance_mean_pct = _weighted_mean(df["gct_balance_pct"].to_numpy(dtype=float), weights)
+    if "gct_balance_pct" in cols:
+        gct_balance_mean_pct = _weighted_mean(cols["gct_balance_pct"], weights)
 
     if (
         stride_length_mean_m == stride_length_mean_m
@@ -609,50 +792,51 @@ def compute_garmin_like_stats(
     }
 
     heart_rate = None
+    hr_zone_times = None
     cardiac_drift_pct = math.nan
     cardiac_drift_slope_pct = math.nan
-    if "heart_rate" in df and df["heart_rate"].notna().any():
-        hr_values = df["heart_rate"].to_numpy(dtype=float)
-        hr_mask = np.isfinite(hr_values) & (weights > 0)
-        hr_max_obs = float(np.nanmax(hr_values[hr_mask])) if hr_mask.any() else math.nan
-        hr_min_obs = float(np.nanmin(hr_values[hr_mask])) if hr_mask.any() else math.nan
+    if "heart_rate" in cols:
+        hr_values = cols["heart_rate"]
+        hr_finite = np.isfinite(hr_values)
+        hr_mask = hr_finite & has_weight
+        hr_max_obs = float(np.max(hr_values[hr_mask])) if hr_mask.any() else math.nan
+        hr_min_obs = float(np.min(hr_values[hr_mask])) if hr_mask.any() else math.nan
         hr_max_used = float(hr_max) if hr_max and hr_max > 0 else hr_max_obs
         hr_mean = _weighted_mean(hr_values, weights)
-        ratio_first = _half_overlap_ratio(delta_dist * mask)
-        ratio_second = np.zeros_like(ratio_first, dtype=float)
-        valid_dist = (delta_dist * mask) > 0
-        ratio_second[valid_dist] = 1.0 - ratio_first[valid_dist]
+        ratio_second = np.where(dist_masked > 0, 1.0 - ratio_first, 0.0)
         hr_pace_ratio = np.full_like(hr_values, np.nan, dtype=float)
-        valid_ratio = np.isfinite(hr_values) & np.isfinite(pace_for_ratio) & (pace_for_ratio > 0)
+        valid_ratio = hr_finite & np.isfinite(pace_for_ratio) & (pace_for_ratio > 0)
         np.divide(hr_values, pace_for_ratio, out=hr_pace_ratio, where=valid_ratio)
         ratio_first_mean = _weighted_mean(hr_pace_ratio, weights * ratio_first)
         ratio_second_mean = _weighted_mean(hr_pace_ratio, weights * ratio_second)
         if ratio_first_mean == ratio_first_mean and ratio_first_mean > 0 and ratio_second_mean == ratio_second_mean:
             cardiac_drift_pct = ((ratio_second_mean - ratio_first_mean) / ratio_first_mean) * 100.0
-        valid_slope = valid_ratio & (weights > 0) & mask
+        valid_slope = valid_ratio & has_weight
         if valid_slope.any():
-            cum_dist = np.cumsum(delta_dist * mask) / 1000.0
-            x = cum_dist[valid_slope]
+            x = cum_dist_km[valid_slope]
             y = hr_pace_ratio[valid_slope]
             w = weights[valid_slope]
-            if len(x) >= 2 and np.nanmax(x) > np.nanmin(x):
-                slope = float(np.polyfit(x, y, 1, w=w)[0])
+            if len(x) >= 2 and x[-1] > x[0]:
+                slope = _linear_slope(x, y, w)
                 mean_ratio = _weighted_mean(y, w)
-                dist_span = float(np.nanmax(x) - np.nanmin(x))
+                dist_span = float(x[-1] - x[0])
                 if mean_ratio > 0 and dist_span > 0:
                     cardiac_drift_slope_pct = (slope * dist_span / mean_ratio) * 100.0
-        hr_ratio = np.full_like(hr_values, np.nan, dtype=float)
+        # Ratios calcules en place (une seule allocation par serie).
         if hr_max_used and hr_max_used > 0:
             if use_hrr and hr_rest is not None and hr_rest < hr_max_used:
-                hr_ratio = (hr_values - hr_rest) / (hr_max_used - hr_rest)
+                hr_ratio = hr_values - hr_rest
+                hr_ratio /= hr_max_used - hr_rest
             else:
                 hr_ratio = hr_values / hr_max_used
-        hr_ratio = np.where(hr_ratio < 0, np.nan, hr_ratio)
-        hr_zones = _build_zone_table(
-            hr_ratio,
-            weights,
+            hr_ratio[hr_ratio < 0] = np.nan
+        else:
+            hr_ratio = np.full_like(hr_values, np.nan, dtype=float)
+        hr_zone_times = _zone_times(hr_ratio, weights, HR_ZONES)
+        hr_zones = _zone_table(
+            hr_zone_times,
             HR_ZONES,
-            lambda low, high: f">= {int(low*100)}%" if math.isinf(high) else f"{int(low*100)}-{int(high*100)}%",
+            _zone_labels(tuple(HR_ZONES), "%"),
         )
         heart_rate = {
             "mean_bpm": float(hr_mean),
@@ -663,20 +847,21 @@ def compute_garmin_like_stats(
         }
 
     training_load = None
-    if heart_rate is not None and heart_rate.get("zones") is not None:
-        trimp = _edwards_trimp_from_zones(heart_rate["zones"])
+    if heart_rate is not None and hr_zone_times is not None:
+        trimp = _edwards_trimp(hr_zone_times[0])
         if trimp == trimp:
             training_load = {"trimp": float(trimp), "method": "edwards"}
 
     cadence = None
-    if "cadence" in df and df["cadence"].notna().any():
-        cad_values = df["cadence"].to_numpy(dtype=float)
+    if "cadence" in cols:
+        cad_values = cols["cadence"]
         cad_mean = _weighted_mean(cad_values, weights)
         cad_max = float(np.nanmax(cad_values)) if np.isfinite(cad_values).any() else math.nan
         above_pct = math.nan
         if cadence_target is not None and cadence_target > 0:
-            mask_target = np.isfinite(cad_values) & (weights > 0) & (cad_values >= cadence_target)
-            total = float(weights[np.isfinite(cad_values) & (weights > 0)].sum())
+            cad_weighted = np.isfinite(cad_values) & has_weight
+            mask_target = cad_weighted & (cad_values >= cadence_target)
+            total = float(weights[cad_weighted].sum())
             above = float(weights[mask_target].sum())
             above_pct = (above / total) * 100.0 if total > 0 else math.nan
         cadence = {
@@ -689,25 +874,26 @@ def compute_garmin_like_stats(
     power = None
     ftp_used = math.nan
     power_advanced = None
-    if "power" in df and df["power"].notna().any():
-        power_values = df["power"].to_numpy(dtype=float)
+    if "power" in cols:
+        power_values = cols["power"]
         power_mean = _weighted_mean(power_values, weights)
         power_max = float(np.nanmax(power_values)) if np.isfinite(power_values).any() else math.nan
         ftp_used = float(ftp_w) if ftp_w and ftp_w > 0 else math.nan
         if ftp_used != ftp_used:
-            ftp_mask = np.isfinite(power_values) & (weights > 0)
-            ftp_used = float(np.nanpercentile(power_values[ftp_mask], 95)) if ftp_mask.any() else math.nan
+            ftp_mask = np.isfinite(power_values) & has_weight
+            ftp_used = float(np.percentile(power_values[ftp_mask], 95)) if ftp_mask.any() else math.nan
             ftp_estimated = True
         else:
             ftp_estimated = False
-        power_ratio = np.full_like(power_values, np.nan, dtype=float)
         if ftp_used and ftp_used > 0:
             power_ratio = power_values / ftp_used
+        else:
+            power_ratio = np.full_like(power_values, np.nan, dtype=float)
         power_zones = _build_zone_table(
             power_ratio,
             weights,
             POWER_ZONES,
-            lambda low, high: f">= {int(low*100)}% FTP" if math.isinf(high) else f"{int(low*100)}-{int(high*100)}% FTP",
+            _zone_labels(tuple(POWER_ZONES), "% FTP"),
         )
         power = {
             "mean_w": float(power_mean),
@@ -717,8 +903,8 @@ def compute_garmin_like_stats(
             "zones": power_zones,
         }
 
-        power_series_1hz = _resample_series_1hz(power_values, delta_time, mask)
-        normalized_power_w = _normalized_power_from_series(power_series_1hz)
+        power_values_1hz = _resample_series_1hz(power_values, delta_time, mask)
+        normalized_power_w = _normalized_power_from_series(power_values_1hz)
         intensity_factor = (
             float(normalized_power_w / ftp_used)
             if normalized_power_w == normalized_power_w and ftp_used == ftp_used and ftp_used > 0
@@ -738,13 +924,13 @@ def compute_garmin_like_stats(
             "intensity_factor": float(intensity_factor),
             "tss": float(tss),
         }
-        power_curve = _compute_power_duration_curve_from_series(power_series_1hz, POWER_PEAK_DURATIONS_S)
+        power_curve = _compute_power_duration_curve_from_series(power_values_1hz, POWER_PEAK_DURATIONS_S)
         if power_curve:
             power_advanced["power_duration_curve"] = power_curve
 
     pace_zones = None
     pace_threshold = pace_threshold_s_per_km
-    if pace_threshold is None or pace_threshold != pace_threshold:
+    if pace_threshold is None or math.isnan(pace_threshold):
         pace_threshold = pace_median
     if pace_threshold and pace_threshold > 0 and pace_mask.any():
         pace_ratio = pace / pace_threshold
@@ -752,23 +938,29 @@ def compute_garmin_like_stats(
             pace_ratio,
             weights,
             PACE_ZONES,
-            lambda low, high: f">= {int(low*100)}% seuil"
-            if math.isinf(high)
-            else f"{int(low*100)}-{int(high*100)}% seuil",
+            _zone_labels(tuple(PACE_ZONES), "% seuil"),
         )
 
-    pacing = {
-        "pace_first_half_s_per_km": float(pace_first),
-        "pace_second_half_s_per_km": float(pace_second),
-        "pace_delta_s_per_km": float(pace_delta),
-        "drift_s_per_km_per_km": float(drift),
-        "cardiac_drift_pct": float(cardiac_drift_pct),
-        "cardiac_drift_slope_pct": float(cardiac_drift_slope_pct),
-        "stability_cv": float(stability_cv),
-        "stability_iqr_ratio": float(stability_iqr),
-        "gap_residual_median_s": float(gap_residual),
-        "pace_threshold_s_per_km": float(pace_threshold) if pace_threshold == pace_threshold else math.nan,
-    }
+    pacing = dict(
+        zip(
+            _PACING_KEYS,
+            map(
+                float,
+                (
+                    pace_first,
+                    pace_second,
+                    pace_delta,
+                    drift,
+                    cardiac_drift_pct,
+                    cardiac_drift_slope_pct,
+                    stability_cv,
+                    stability_iqr,
+                    gap_residual,
+                    pace_threshold,
+                ),
+            ),
+        )
+    )
 
     return {
         "summary": summary,
@@ -783,12 +975,31 @@ def compute_garmin_like_stats(
     }
 
 
+def _mmss_labels(seconds: np.ndarray) -> np.ndarray:
+    """seconds_to_mmss vectorise ("-" pour NaN)."""
+    missing = np.isnan(seconds)
+    total = np.round(np.where(missing, 0.0, seconds)).astype(np.int64)
+    minutes, secs = np.divmod(total, 60)
+    labels = np.char.add(np.char.add(minutes.astype(str), ":"), np.char.zfill(secs.astype(str), 2))
+    return np.where(missing, "-", labels).astype(object)
+
+
+def _pct_labels(pct: np.ndarray) -> np.ndarray:
+    """Pourcentages "12.3%" vectorises ("-" pour NaN)."""
+    missing = np.isnan(pct)
+    labels = np.char.mod("%.1f%%", np.where(missing, 0.0, pct))
+    return np.where(missing, "-", labels).astype(object)
+
+
 def format_zone_table(df: pd.DataFrame) -> pd.DataFrame:
     if df is None or df.empty:
         return pd.DataFrame(columns=["Zone", "Plage", "Temps", "% Temps"])
-    formatted = df.copy()
-    formatted["Temps"] = formatted["time_s"].apply(lambda v: seconds_to_mmss(v) if v == v else "-")
-    formatted["% Temps"] = formatted["time_pct"].apply(lambda v: f"{v:.1f}%" if v == v else "-")
-    return formatted[["zone", "range", "Temps", "% Temps"]].rename(
-        columns={"zone": "Zone", "range": "Plage"}
+    return pd.DataFrame(
+        {
+            "Zone": df["zone"].to_numpy(),
+            "Plage": df["range"].to_numpy(),
+            "Temps": _mmss_labels(df["time_s"].to_numpy(dtype=float)),
+            "% Temps": _pct_labels(df["time_pct"].to_numpy(dtype=float)),
+        },
+        index=df.index,
     )
@@ -9,11 +9,12 @@ def parse_km_list(raw: str) -> list[float]:
     Example inputs: "5,10,21.1", "5 km, 10km".
     """
 
+    if not raw:
+        return []
+    # "km" cannot span a comma, so lower/replace run once on the whole text;
+    # float() already ignores surrounding whitespace and rejects empty fields.
     distances: list[float] = []
-    for part in raw.split(","):
-        text = part.strip().lower().replace("km", "")
-        if not text:
-            continue
+    for text in raw.lower().replace("km", "").split(","):
         try:
             val = float(text)
         except ValueError:
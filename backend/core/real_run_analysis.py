@@ -9,7 +9,7 @@ from core.ref_data import get_pro_pace_vs_grade_df
 from core.transform_report import TransformReport
 from core.derived import DerivedSeries
 from core.utils import seconds_to_mmss
-from core.stats.basic_stats import compute_basic_stats
+from core.stats.basic_stats import BasicStats, compute_basic_stats
 from core.constants import (
     DEFAULT_GRADE_SMOOTH_WINDOW,
     DEFAULT_MIN_PAUSE_DURATION_S,
@@ -192,10 +192,21 @@ def compute_derived_series(
     return DerivedSeries(grade_series=grade_series, moving_mask=moving_mask, gap_series=gap_series)
 
 
-def compute_summary_stats(df: pd.DataFrame, moving_mask: pd.Series | None = None) -> Dict[str, float]:
-    """Calcule les statistiques principales d'une sortie reelle."""
-    moving_mask = moving_mask if moving_mask is not None else compute_moving_mask(df)
-    stats = compute_basic_stats(df, moving_mask=moving_mask)
+def compute_summary_stats(
+    df: pd.DataFrame,
+    moving_mask: pd.Series | None = None,
+    *,
+    basic_stats: BasicStats | None = None,
+) -> Dict[str, float]:
+    """Calcule les statistiques principales d'une sortie reelle.
+
+    `basic_stats` (calcule avec le meme moving mask) evite un second passage.
+    """
+    if basic_stats is not None:
+        stats = basic_stats
+    else:
+        moving_mask = moving_mask if moving_mask is not None else compute_moving_mask(df)
+        stats = compute_basic_stats(df, moving_mask=moving_mask)
 
     average_pace_s_per_km = stats.total_time_s / stats.distance_km if stats.distance_km > 0 else math.nan
     average_speed_kmh = (stats.distance_km) / (stats.total_time_s / 3600.0) if stats.total_time_s > 0 else math.nan
@@ -495,14 +506,15 @@ def compute_race_predictions(
     if base.empty:
         return []
 
+    base_rows = list(base[["distance_km", "time_s"]].itertuples(index=False, name=None))
     out: list[dict[str, float]] = []
     for target in targets_km:
         best_time = math.nan
         best_base_dist = math.nan
         best_base_time = math.nan
-        for _, row in base.iterrows():
-            dist_km = float(row["distance_km"])
-            time_s = float(row["time_s"])
+        for dist_km, time_s in base_rows:
+            dist_km = float(dist_km)
+            time_s = float(time_s)
             if dist_km <= 0 or time_s <= 0:
                 continue
             predicted = time_s * (target / dist_km) ** exponent
@@ -13,6 +13,43 @@ from core.transform_report import TransformReport
 from core.utils import seconds_to_mmss
 
 
+def _theoretical_segment_arrays(
+    dist: np.ndarray,
+    elev: np.ndarray,
+    valid: np.ndarray,
+    base_pace_s_per_km: float,
+) -> Dict[str, np.ndarray]:
+    """Colonnes par segment valide (point i -> i+1) du modele theorique."""
+    segment_distance_m = (dist[1:] - dist[:-1])[valid]
+    segment_distance_km = segment_distance_m / 1000.0
+
+    elev_current = elev[:-1][valid]
+    elev_next = elev[1:][valid]
+    delta_elev = np.where(np.isnan(elev_current) | np.isnan(elev_next), 0.0, elev_next - elev_current)
+
+    grade_percent = (delta_elev / segment_distance_m) * 100.0
+    pace_factor = grade_factor(grade_percent)
+    segment_pace_s_per_km = base_pace_s_per_km * pace_factor
+    segment_time_s = segment_pace_s_per_km * segment_distance_km
+    cumulative_time_s = np.cumsum(segment_time_s)
+
+    return {
+        "distance_km_cumulative": dist[1:][valid] / 1000.0,
+        "segment_distance_km": segment_distance_km,
+        "segment_grade_percent": grade_percent,
+        "segment_pace_s_per_km": segment_pace_s_per_km,
+        "segment_time_s": segment_time_s,
+        "cumulative_time_s": cumulative_time_s,
+        "elevation_m": elev_next,
+    }
+
+
+def _valid_segments(dist: np.ndarray) -> np.ndarray:
+    dist_current = dist[:-1]
+    dist_next = dist[1:]
+    return np.isfinite(dist_current) & np.isfinite(dist_next) & ((dist_next - dist_current) > 0)
+
+
 def compute_theoretical_timing(
     df: pd.DataFrame,
     base_pace_s_per_km: float,
@@ -52,11 +89,7 @@ def compute_theoretical_timing(
 
     dist = df["distance_m"].to_numpy()
     elev = df["elevation"].to_numpy()
-    dist_current = dist[:-1]
-    dist_next = dist[1:]
-    segment_distance_m = dist_next - dist_current
-
-    valid = np.isfinite(dist_current) & np.isfinite(dist_next) & (segment_distance_m > 0)
+    valid = _valid_segments(dist)
     if report is not None:
         report.add(
             "theoretical:valid_segments",
@@ -71,29 +104,8 @@ def compute_theoretical_timing(
             result["passage_datetime"] = start_ts + pd.to_timedelta(result["cumulative_time_s"], unit="s")
         return result
 
-    segment_distance_m = segment_distance_m[valid]
-    segment_distance_km = segment_distance_m / 1000.0
-
-    elev_current = elev[:-1][valid]
-    elev_next = elev[1:][valid]
-    delta_elev = np.where(np.isnan(elev_current) | np.isnan(elev_next), 0.0, elev_next - elev_current)
-
-    grade_percent = (delta_elev / segment_distance_m) * 100.0
-    pace_factor = grade_factor(grade_percent)
-    segment_pace_s_per_km = base_pace_s_per_km * pace_factor
-    segment_time_s = segment_pace_s_per_km * segment_distance_km
-    cumulative_time_s = np.cumsum(segment_time_s)
-
     result = pd.DataFrame(
-        {
-            "distance_km_cumulative": dist_next[valid] / 1000.0,
-            "segment_distance_km": segment_distance_km,
-            "segment_grade_percent": grade_percent,
-            "segment_pace_s_per_km": segment_pace_s_per_km,
-            "segment_time_s": segment_time_s,
-            "cumulative_time_s": cumulative_time_s,
-            "elevation_m": elev_next,
-        },
+        _theoretical_segment_arrays(dist, elev, valid, base_pace_s_per_km),
         columns=columns,
     )
     if not result.empty and start_datetime is not None:
@@ -165,18 +177,57 @@ def compute_theoretical_summary(df_theoretical: pd.DataFrame) -> Dict[str, float
     Résumé global à partir du DataFrame théorique.
     """
     if df_theoretical.empty:
-        return {
-            "total_time_s": 0.0,
-            "total_distance_km": 0.0,
-            "average_pace_s_per_km": math.nan,
-            "elevation_gain_m": 0.0,
-        }
-
-    total_time_s = float(df_theoretical["cumulative_time_s"].iloc[-1])
-    total_distance_km = float(df_theoretical["distance_km_cumulative"].iloc[-1])
+        return _empty_theoretical_summary()
+
+    return _theoretical_summary_from_arrays(
+        df_theoretical["cumulative_time_s"].to_numpy(),
+        df_theoretical["distance_km_cumulative"].to_numpy(),
+        df_theoretical["elevation_m"].to_numpy(),
+    )
+
+
+def compute_theoretical_summary_from_track(df: pd.DataFrame, base_pace_s_per_km: float) -> Dict[str, float]:
+    """
+    Résumé théorique calculé directement sur les tableaux numpy, sans construire
+    le DataFrame par segment (même résultat que compute_theoretical_summary(compute_theoretical_timing(...))).
+    """
+    if len(df) < 2:
+        return _empty_theoretical_summary()
+
+    dist = df["distance_m"].to_numpy()
+    elev = df["elevation"].to_numpy()
+    valid = _valid_segments(dist)
+    if not valid.any():
+        return _empty_theoretical_summary()
+
+    arrays = _theoretical_segment_arrays(dist, elev, valid, base_pace_s_per_km)
+    return _theoretical_summary_from_arrays(
+        arrays["cumulative_time_s"],
+        arrays["distance_km_cumulative"],
+        arrays["elevation_m"],
+    )
+
+
+def _empty_theoretical_summary() -> Dict[str, float]:
+    return {
+        "total_time_s": 0.0,
+        "total_distance_km": 0.0,
+        "average_pace_s_per_km": math.nan,
+        "elevation_gain_m": 0.0,
+    }
+
+
+def _theoretical_summary_from_arrays(
+    cumulative_time_s: np.ndarray,
+    distance_km_cumulative: np.ndarray,
+    elevation_m: np.ndarray,
+) -> Dict[str, float]:
+    total_time_s = float(cumulative_time_s[-1])
+    total_distance_km = float(distance_km_cumulative[-1])
     average_pace_s_per_km = total_time_s / total_distance_km if total_distance_km > 0 else math.nan
 
-    elevation = df_theoretical["elevation_m"].dropna().to_numpy()
+    elevation = elevation_m.astype(float)
+    elevation = elevation[~np.isnan(elevation)]
     elevation_gain_m = float(np.clip(np.diff(elevation), 0, None).sum()) if len(elevation) > 1 else 0.0
 
     return {
@@ -1,3 +1,4 @@
+import weakref
 from dataclasses import dataclass
 from typing import List, Literal, Optional, Callable, Dict, Any, cast
 import pandas as pd
@@ -128,6 +129,8 @@ class SeriesRegistry:
                 requires_params={"ftp": int}
             )
         }
+        # Series disponibles par DataFrame (cle id(df), purgee quand le DataFrame est libere).
+        self._available_cache: Dict[int, List[SeriesInfo]] = {}
         
     def _compute_grade_series(self, df: pd.DataFrame) -> pd.Series:
         """Calcule série de pente (%) via l'implémentation core.
@@ -160,7 +163,16 @@ class SeriesRegistry:
         return bool(np.issubdtype(arr.dtype, np.number))
         
     def get_available_series(self, df: pd.DataFrame) -> List[SeriesInfo]:
-        """Retourne séries disponibles selon données présentes"""
+        """Retourne séries disponibles selon données présentes (memoise par DataFrame)"""
+        key = id(df)
+        cached = self._available_cache.get(key)
+        if cached is None:
+            cached = self._compute_available_series(df)
+            self._available_cache[key] = cached
+            weakref.finalize(df, self._available_cache.pop, key, None)
+        return list(cached)
+
+    def _compute_available_series(self, df: pd.DataFrame) -> List[SeriesInfo]:
         available = []
         
         for name, definition in self._registry.items():
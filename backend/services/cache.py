@@ -3,6 +3,7 @@ from __future__ import annotations
 import hashlib
 import json
 import pickle
+import weakref
 from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
@@ -84,6 +85,43 @@ class MemoryCache:
             self.set(key, value)
             return value
 
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+class FrameCache:
+    """Memoisation de valeurs derivees d'un DataFrame (cle id(df) + nom).
+
+    Les entrees sont purgees quand le DataFrame est libere (weakref.finalize), ce qui
+    suit naturellement l'eviction du cache de DataFrames du storage. Les valeurs
+    sont partagees: les appelants ne doivent pas les modifier en place.
+    """
+
+    def __init__(self) -> None:
+        self._lock = RLock()
+        self._data: dict[tuple[int, str], Any] = {}
+
+    def get_or_compute(self, df: Any, name: str, factory: Callable[[], T]) -> T:
+        key = (id(df), name)
+        with self._lock:
+            if key in self._data:
+                return self._data[key]
+        value = factory()
+        with self._lock:
+            if key not in self._data:
+                self._data[key] = value
+                weakref.finalize(df, self._data.pop, key, None)
+            return self._data[key]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
 
 class DiskCache:
     """Cache optionnel base sur pickle (a garder desactive sauf besoin)."""
@@ -8,6 +8,7 @@ from typing import Any
 import numpy as np
 import pandas as pd
 
+from core.derived import DerivedSeries
 from core.ref_data import get_pro_pace_vs_grade_df
 from core.transform_report import TransformReport
 from core.metrics import compute_garmin_like_stats, estimate_zone_inputs
@@ -28,7 +29,9 @@ from core.real_run_analysis import (
     compute_splits,
     compute_summary_stats,
 )
+from core.stats.basic_stats import BasicStats, compute_basic_stats
 from core.utils import seconds_to_mmss
+from services.cache import FrameCache
 from services.models import (
     RealRunBase,
     RealRunDerived,
@@ -41,6 +44,33 @@ from services.models import (
 )
 
 
+# Derives partages entre /real et /pace-vs-grade pour un meme DataFrame (cache storage).
+_FRAME_CACHE = FrameCache()
+
+
+def get_derived_series(df: pd.DataFrame) -> DerivedSeries:
+    """compute_derived_series(df) memoise par DataFrame (parametres par defaut)."""
+    return _FRAME_CACHE.get_or_compute(df, "derived", lambda: compute_derived_series(df))
+
+
+def get_basic_stats(df: pd.DataFrame) -> BasicStats:
+    """compute_basic_stats(df) memoise par DataFrame, sur le moving mask par defaut."""
+    return _FRAME_CACHE.get_or_compute(
+        df,
+        "basic_stats",
+        lambda: compute_basic_stats(df, moving_mask=get_derived_series(df).moving_mask),
+    )
+
+
+def get_summary_stats(df: pd.DataFrame) -> dict[str, Any]:
+    """compute_summary_stats(df) memoise par DataFrame, sur le moving mask par defaut."""
+    return _FRAME_CACHE.get_or_compute(
+        df,
+        "summary",
+        lambda: compute_summary_stats(df, basic_stats=get_basic_stats(df)),
+    )
+
+
 def _default_cap_min_per_km(summary: dict[str, Any]) -> float:
     avg = summary.get("average_pace_s_per_km")
     if isinstance(avg, (int, float)) and avg == avg and avg > 0:
@@ -49,14 +79,14 @@ def _default_cap_min_per_km(summary: dict[str, Any]) -> float:
 
 
 def prepare_base(df: pd.DataFrame) -> RealRunBase:
-    derived_raw = compute_derived_series(df)
+    derived_raw = get_derived_series(df)
     derived = RealRunDerived(
         grade_series=derived_raw.grade_series,
         moving_mask=derived_raw.moving_mask,
         gap_series=derived_raw.gap_series,
     )
 
-    summary = compute_summary_stats(df, moving_mask=derived.moving_mask)
+    summary = get_summary_stats(df)
     zone_defaults = estimate_zone_inputs(df, moving_mask=derived.moving_mask)
     best_efforts = compute_best_efforts(df)
     best_efforts_time = compute_best_efforts_by_duration(df)
@@ -270,6 +300,7 @@ def compute_garmin_stats(
         ftp_w=params.ftp_w,
         cadence_target=params.cadence_target,
         use_moving_time=params.use_moving_time,
+        basic_stats=get_basic_stats(df),
     )
 
 
@@ -11,7 +11,8 @@ from __future__ import annotations
 
 from dataclasses import fields, is_dataclass
 from datetime import date, datetime
-from typing import Any
+from functools import lru_cache
+from typing import Any, Callable
 
 import numpy as np
 import pandas as pd
@@ -44,16 +45,70 @@ def df_to_records(df: pd.DataFrame, *, limit: int | None = None) -> list[dict[st
         return []
     if limit is not None:
         df = df.head(int(limit))
-    # Remplace NaN/NaT par None pour JSON.
-    # IMPORTANT: cast en object pour conserver None dans les colonnes numeriques.
-    safe = df.copy().astype(object)
-    safe = safe.where(pd.notna(safe), None)
+    if len(df.columns) == 0:
+        return [{} for _ in range(len(df))]
 
-    # Convertit les timestamps en chaines ISO.
-    dt_cols = [c for c in df.columns if pd.api.types.is_datetime64_any_dtype(df[c])]
-    for col in dt_cols:
-        safe[col] = safe[col].apply(lambda v: _dt_to_iso(v))
-    return safe.to_dict(orient="records")
+    # Construction colonne par colonne (une liste Python par colonne), puis zip en lignes:
+    # evite la copie object du DataFrame entier et le boxing cellule par cellule de to_dict.
+    # Les convertisseurs sont choisis une fois par schema (colonnes, dtypes).
+    builder = _records_builder(tuple(df.columns), tuple(df.dtypes))
+    return builder(df)
+
+
+@lru_cache(maxsize=64)
+def _records_builder(keys: tuple, dtypes: tuple) -> Callable[[pd.DataFrame], list[dict[str, Any]]]:
+    key_list = list(keys)
+    converters = tuple(_converter_for_dtype(dtype) for dtype in dtypes)
+
+    def build(df: pd.DataFrame) -> list[dict[str, Any]]:
+        columns = [convert(col) for convert, (_, col) in zip(converters, df.items())]
+        return [dict(zip(key_list, row)) for row in zip(*columns)]
+
+    return build
+
+
+def _converter_for_dtype(dtype: Any) -> Callable[[pd.Series], list[Any]]:
+    # Chemins rapides reserves aux dtypes numpy; extensions pandas -> conversion generique.
+    if isinstance(dtype, np.dtype):
+        if dtype.kind == "M":
+            return _datetime_to_list
+        if dtype.kind == "f":
+            return _float_to_list
+        if dtype.kind in "iub":
+            return _native_to_list
+    return _column_to_list
+
+
+def _datetime_to_list(col: pd.Series) -> list[Any]:
+    return [_dt_to_iso(v) for v in col]
+
+
+def _float_to_list(col: pd.Series) -> list[Any]:
+    # tolist() en C, puis remplacement cible des NaN.
+    arr = col.to_numpy()
+    values = arr.tolist()
+    for i in np.flatnonzero(np.isnan(arr)).tolist():
+        values[i] = None
+    return values
+
+
+def _native_to_list(col: pd.Series) -> list[Any]:
+    return col.to_numpy().tolist()
+
+
+def _column_to_list(col: pd.Series) -> list[Any]:
+    """Convertit une colonne en liste JSON-ready selon son dtype (NaN/NaT -> None)."""
+    if pd.api.types.is_datetime64_any_dtype(col):
+        return _datetime_to_list(col)
+
+    kind = col.to_numpy().dtype.kind
+    if kind == "f":
+        return _float_to_list(col)
+    if kind in "iub":
+        return _native_to_list(col)
+
+    # object / dtypes extension: cast object pour conserver None.
+    return col.astype(object).where(col.notna(), None).tolist()
 
 
 def series_to_list(series: pd.Series, *, limit: int | None = None) -> list[Any]:
@@ -84,6 +139,13 @@ def to_jsonable(obj: Any, *, dataframe_limit: int | None = None) -> Any:
     if obj is None:
         return None
 
+    # Chemin rapide: primitives JSON exactes (la majorite des feuilles des payloads).
+    cls = type(obj)
+    if cls is str or cls is int or cls is bool:
+        return obj
+    if cls is float:
+        return None if obj != obj else obj
+
     # Valeurs speciales pandas
     if obj is pd.NaT:
         return None
@@ -15,6 +15,7 @@ from core.theoretical_model import (
     compute_passage_at_distances,
     compute_theoretical_splits,
     compute_theoretical_summary,
+    compute_theoretical_summary_from_track,
     compute_theoretical_timing,
 )
 from core.utils import seconds_to_mmss
@@ -33,6 +34,11 @@ def prepare_base(df: pd.DataFrame, base_pace_s_per_km: float) -> tuple[pd.DataFr
     return df_theoretical, summary_base
 
 
+def prepare_base_summary_only(df: pd.DataFrame, base_pace_s_per_km: float) -> dict[str, Any]:
+    """Resume de prepare_base() sans materialiser le DataFrame theorique."""
+    return compute_theoretical_summary_from_track(df, base_pace_s_per_km)
+
+
 def compute_display_df(
     df_theoretical: pd.DataFrame,
     *,
@@ -9,14 +9,21 @@ import shutil
 import logging
 
 import pandas as pd
+import pyarrow as pa
+from pyarrow import feather
 
 from api.schemas import ActivityMetadata, SidebarStats
 from core.stats.basic_stats import compute_basic_stats
+from services.cache import MemoryCache
 from services.models import LoadedActivity as ServiceLoadedActivity
 
 
 logger = logging.getLogger("coursescope")
 
+# Arrow IPC (Feather v2) non compresse: relecture sans decodage, contrairement au parquet.
+_DF_FILENAME = "df.feather"
+_LEGACY_DF_FILENAME = "df.parquet"
+
 
 def _model_to_dict(model):
     if hasattr(model, "model_dump"):
@@ -26,7 +33,14 @@ def _model_to_dict(model):
 
 class ActivityStorage(ABC):
     @abstractmethod
-    def store(self, activity: ServiceLoadedActivity, filename: str, raw_bytes: bytes, name: str | None = None) -> str:
+    def store(
+        self,
+        activity: ServiceLoadedActivity,
+        filename: str,
+        raw_bytes: bytes,
+        name: str | None = None,
+        stats_sidebar: SidebarStats | None = None,
+    ) -> str:
         """Stocke activité, retourne ID"""
         pass
 
@@ -59,9 +73,12 @@ class ActivityStorage(ABC):
 class LocalTempStorage(ActivityStorage):
     """Stockage local dans dossier persistant"""
 
-    def __init__(self, temp_dir: str = "./data/activities"):
+    def __init__(self, temp_dir: str = "./data/activities", df_cache_size: int = 32):
         self.temp_dir = Path(temp_dir)
         self.temp_dir.mkdir(parents=True, exist_ok=True)
+        # DataFrames deja relus, partages entre /real, /theoretical, /series et /map.
+        # Les consommateurs ne doivent pas les modifier en place.
+        self._df_cache = MemoryCache(max_items=df_cache_size)
 
     def _get_extension(self, filename: str) -> str:
         """Extrait l'extension du fichier"""
@@ -92,8 +109,19 @@ class LocalTempStorage(ActivityStorage):
             elevation_gain_m=stats.elevation_gain_m if stats.elevation_gain_m > 0 else None,
         )
 
-    def store(self, activity: ServiceLoadedActivity, filename: str, raw_bytes: bytes, name: str | None = None) -> str:
-        """Stocke activité avec UUID unique"""
+    def store(
+        self,
+        activity: ServiceLoadedActivity,
+        filename: str,
+        raw_bytes: bytes,
+        name: str | None = None,
+        stats_sidebar: SidebarStats | None = None,
+    ) -> str:
+        """Stocke activité avec UUID unique
+
+        `stats_sidebar` permet de reutiliser des stats deja calculees par l'appelant
+        (evite un second passage de compute_basic_stats).
+        """
         activity_id = str(uuid.uuid4())
         activity_dir = self._get_activity_dir(activity_id)
         activity_dir.mkdir(exist_ok=True)
@@ -107,13 +135,13 @@ class LocalTempStorage(ActivityStorage):
             if df is None:
                 raise RuntimeError("Loaded activity is missing DataFrame data")
 
-            df_path = activity_dir / "df.parquet"
+            df_path = activity_dir / _DF_FILENAME
             df_to_store = df.copy()
             for column in df_to_store.columns:
                 if isinstance(df_to_store[column].dtype, pd.DatetimeTZDtype):
                     df_to_store[column] = df_to_store[column].dt.tz_convert("UTC").dt.tz_localize(None)
             logger.info(
-                "store_parquet_start",
+                "store_dataframe_start",
                 extra={
                     "request_id": "-",
                     "activity_id": activity_id,
@@ -121,9 +149,9 @@ class LocalTempStorage(ActivityStorage):
                     "cols": int(df_to_store.shape[1]),
                 },
             )
-            df_to_store.to_parquet(df_path, engine="pyarrow")
+            feather.write_feather(pa.Table.from_pandas(df_to_store), df_path, compression="uncompressed")
             logger.info(
-                "store_parquet_ok",
+                "store_dataframe_ok",
                 extra={
                     "request_id": "-",
                     "activity_id": activity_id,
@@ -139,7 +167,7 @@ class LocalTempStorage(ActivityStorage):
                 name=name,
                 activity_type=activity_type,
                 created_at=datetime.now(),
-                stats_sidebar=self._compute_sidebar_stats(df),
+                stats_sidebar=stats_sidebar if stats_sidebar is not None else self._compute_sidebar_stats(df),
                 file_hash=self._hash_bytes(raw_bytes),
             )
 
@@ -178,14 +206,25 @@ class LocalTempStorage(ActivityStorage):
         )
 
     def load_dataframe(self, activity_id: str) -> pd.DataFrame:
-        """Charge DataFrame pour lazy loading"""
+        """Charge DataFrame pour lazy loading (cache LRU en memoire)"""
+        return self._df_cache.get_or_set(activity_id, lambda: self._read_dataframe(activity_id))
+
+    def _read_dataframe(self, activity_id: str) -> pd.DataFrame:
         activity_dir = self._get_activity_dir(activity_id)
-        df_path = activity_dir / "df.parquet"
+        df_path = activity_dir / _DF_FILENAME
+
+        if df_path.exists():
+            # Pas de memory_map: le fichier doit rester supprimable (Windows) meme si le
+            # DataFrame est encore reference.
+            table = feather.read_table(df_path, memory_map=False)
+            return table.to_pandas(split_blocks=True, self_destruct=True)
 
-        if not df_path.exists():
-            raise FileNotFoundError(f"DataFrame for activity {activity_id} not found")
+        # Activites stockees avant le passage a Feather.
+        legacy_path = activity_dir / _LEGACY_DF_FILENAME
+        if legacy_path.exists():
+            return pd.read_parquet(legacy_path)
 
-        return pd.read_parquet(df_path)
+        raise FileNotFoundError(f"DataFrame for activity {activity_id} not found")
 
     def list_activities(self) -> List[ActivityMetadata]:
         """Liste toutes les métadonnées"""
@@ -224,6 +263,7 @@ class LocalTempStorage(ActivityStorage):
 
     def delete(self, activity_id: str) -> bool:
         """Supprime une activité spécifique"""
+        self._df_cache.delete(activity_id)
         activity_dir = self._get_activity_dir(activity_id)
 
         if not activity_dir.exists():
@@ -237,6 +277,7 @@ class LocalTempStorage(ActivityStorage):
 
     def cleanup_all(self) -> None:
         """Suppression complète dossier"""
+        self._df_cache.clear()
         if self.temp_dir.exists():
             shutil.rmtree(self.temp_dir, ignore_errors=True)
         self.temp_dir.mkdir(parents=True, exist_ok=True)
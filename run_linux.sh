@@ -44,6 +44,8 @@ cleanup() {
 trap cleanup EXIT
 
 echo "[INFO] Demarrage API: http://localhost:8000"
+# Les modules backend s'importent en absolu (api.*, core.*, services.*).
+export PYTHONPATH="$PROJECT_DIR/backend${PYTHONPATH:+:$PYTHONPATH}"
 uvicorn backend.api.main:app --reload --host 0.0.0.0 --port 8000 &
 API_PID=$!
 
@@ -7,6 +7,7 @@ cd /d "%PROJECT_DIR%" || goto :fail
 set "VENV_DIR=%PROJECT_DIR%.venv"
 set "PYTHON_EXE=%VENV_DIR%\Scripts\python.exe"
 set "FRONTEND_DIR=%PROJECT_DIR%frontend"
+set "PYTHONPATH=%PROJECT_DIR%backend;%PYTHONPATH%"
 set "LOG_DIR=%PROJECT_DIR%logs"
 set "STARTUP_LOG=%LOG_DIR%\startup_win.log"
 
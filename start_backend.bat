@@ -5,6 +5,7 @@ cd /d "%~dp0" || goto :fail
 
 set "VENV_DIR=%~dp0.venv"
 set "PY=%VENV_DIR%\Scripts\python.exe"
+set "PYTHONPATH=%~dp0backend;%PYTHONPATH%"
 
 where python >nul 2>&1
 if errorlevel 1 (
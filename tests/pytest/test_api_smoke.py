@@ -66,3 +66,30 @@ def test_load_activity_and_fetch_endpoints():
         assert map_resp.status_code == 200
         map_payload = map_resp.json()
         assert "polyline" in map_payload
+
+
+def test_load_activity_rejects_oversized_upload():
+    with TestClient(app) as client:
+        data, filename = _load_fixture_bytes()
+        response = client.post(
+            "/activity/load",
+            files={"file": (filename, data, "application/gpx+xml")},
+            headers={"max-size": str(len(data) - 1)},
+        )
+        assert response.status_code == 413
+
+
+def test_load_activity_accepts_bare_extension_filename():
+    with TestClient(app) as client:
+        data, _ = _load_fixture_bytes()
+        response = client.post(
+            "/activity/load",
+            files={"file": (".GPX", data, "application/gpx+xml")},
+        )
+        assert response.status_code == 200
+
+        response = client.post(
+            "/activity/load",
+            files={"file": ("course.txt", data, "text/plain")},
+        )
+        assert response.status_code == 400
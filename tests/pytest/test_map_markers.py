@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from tests.unit._bootstrap import ensure_project_on_path
+
+
+ensure_project_on_path()
+
+
+def test_extract_markers_collapses_contiguous_pauses() -> None:
+    from api.routes.maps import extract_markers
+
+    df = pd.DataFrame(
+        {
+            "lat": [48.0, 48.1, 48.2, 48.3, np.nan, 48.5, 48.6],
+            "lon": [2.0, 2.1, 2.2, 2.3, np.nan, 2.5, 2.6],
+            "speed_m_s": [3.0, 0.0, 0.05, 3.0, 0.0, 0.0, 3.0],
+            "elevation": [10.0, 11.0, 12.0, 15.0, 13.0, 12.0, 11.0],
+        }
+    )
+
+    markers = extract_markers(df)
+    pauses = [m for m in markers if m.type == "pause"]
+
+    # Pause 1 (index 1-2) -> un marqueur; pause 2 commence apres le point sans coordonnees.
+    assert [(m.lat, m.lon) for m in pauses] == [(48.1, 2.1), (48.5, 2.5)]
+    elevation = [m for m in markers if m.type == "elevation"]
+    assert len(elevation) == 1
+    assert elevation[0].lat == 48.3
+
+
+def test_extract_markers_skips_all_nan_elevation() -> None:
+    from api.routes.maps import extract_markers
+
+    df = pd.DataFrame({"lat": [48.0, 48.1], "lon": [2.0, 2.1], "elevation": [np.nan, np.nan]})
+
+    assert extract_markers(df) == []
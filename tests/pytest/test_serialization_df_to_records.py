@@ -39,3 +39,36 @@ def test_df_to_records_limit_does_not_mutate_input() -> None:
     records = df_to_records(df, limit=1)
     pd.testing.assert_frame_equal(df, before)
     assert len(records) == 1
+
+
+def test_df_to_records_keeps_python_types_per_dtype() -> None:
+    from services.serialization import df_to_records
+
+    df = pd.DataFrame(
+        {
+            "i": np.array([1, 2], dtype=np.int64),
+            "b": [True, False],
+            "s": ["x", None],
+            "f": [np.nan, 2.5],
+        }
+    )
+    records = df_to_records(df)
+
+    assert records == [
+        {"i": 1, "b": True, "s": "x", "f": None},
+        {"i": 2, "b": False, "s": None, "f": 2.5},
+    ]
+    assert type(records[0]["i"]) is int
+    assert type(records[1]["f"]) is float
+
+
+def test_df_to_records_reuses_builder_for_same_schema() -> None:
+    from services.serialization import _records_builder, df_to_records
+
+    df_a = pd.DataFrame({"x": [1.0, np.nan], "n": [1, 2]})
+    df_b = pd.DataFrame({"x": [3.0], "n": [4]})
+    df_to_records(df_a)
+    hits = _records_builder.cache_info().hits
+
+    assert df_to_records(df_b) == [{"x": 3.0, "n": 4}]
+    assert _records_builder.cache_info().hits == hits + 1
@@ -30,3 +30,22 @@ def test_compute_theoretical_timing_reports_valid_segments() -> None:
     valid_step = next(s for s in report.steps if s.name == "theoretical:valid_segments")
     assert valid_step.rows_in == 3
     assert valid_step.rows_out == 2
+
+
+def test_summary_from_track_matches_full_timing_path() -> None:
+    import numpy as np
+
+    from core.theoretical_model import (
+        compute_theoretical_summary,
+        compute_theoretical_summary_from_track,
+        compute_theoretical_timing,
+    )
+
+    df = pd.DataFrame(
+        {
+            "distance_m": [0.0, 10.0, 10.0, 25.0, 60.0],
+            "elevation": [100.0, 101.0, np.nan, 99.0, 103.0],
+        }
+    )
+    expected = compute_theoretical_summary(compute_theoretical_timing(df, base_pace_s_per_km=300.0))
+    assert compute_theoretical_summary_from_track(df, base_pace_s_per_km=300.0) == expected
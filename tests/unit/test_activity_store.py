@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from tests.unit._bootstrap import ensure_project_on_path
+
+
+ensure_project_on_path()
+
+
+class TestLocalTempStorage(unittest.TestCase):
+    def _store_fixture(self, storage) -> str:
+        from services.analysis_service import load_activity
+
+        fixture = Path(__file__).resolve().parents[1] / "course.gpx"
+        data = fixture.read_bytes()
+        activity = load_activity(data=data, name=fixture.name)
+        return storage.store(activity, fixture.name, data)
+
+    def test_load_dataframe_is_cached_and_invalidated_on_delete(self) -> None:
+        from storage.activity_store import LocalTempStorage
+
+        with tempfile.TemporaryDirectory() as tmp:
+            storage = LocalTempStorage(temp_dir=tmp)
+            activity_id = self._store_fixture(storage)
+
+            df = storage.load_dataframe(activity_id)
+            self.assertFalse(df.empty)
+            self.assertIs(storage.load_dataframe(activity_id), df)
+
+            self.assertTrue(storage.delete(activity_id))
+            with self.assertRaises(FileNotFoundError):
+                storage.load_dataframe(activity_id)
+
+    def test_cleanup_all_clears_dataframe_cache(self) -> None:
+        from storage.activity_store import LocalTempStorage
+
+        with tempfile.TemporaryDirectory() as tmp:
+            storage = LocalTempStorage(temp_dir=tmp)
+            activity_id = self._store_fixture(storage)
+            storage.load_dataframe(activity_id)
+
+            storage.cleanup_all()
+            with self.assertRaises(FileNotFoundError):
+                storage.load_dataframe(activity_id)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import json
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from tests.unit._bootstrap import ensure_project_on_path
+
+
+ensure_project_on_path()
+
+
+class TestORJSONResponse(unittest.TestCase):
+    def test_render_numpy_nan_and_timestamps(self) -> None:
+        from api.responses import ORJSONResponse
+
+        payload = {
+            "a": np.float64(1.5),
+            "b": float("nan"),
+            "c": np.array([1.0, np.nan]),
+            "t": pd.Timestamp("2026-01-01 00:00:00"),
+            "nat": pd.NaT,
+            1: "int key",
+        }
+        body = json.loads(ORJSONResponse(content=payload).body)
+
+        self.assertEqual(body["a"], 1.5)
+        self.assertIsNone(body["b"])
+        self.assertEqual(body["c"], [1.0, None])
+        self.assertTrue(body["t"].startswith("2026-01-01"))
+        self.assertIsNone(body["nat"])
+        self.assertEqual(body["1"], "int key")
+
+
+if __name__ == "__main__":
+    unittest.main()
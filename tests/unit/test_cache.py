@@ -31,6 +31,29 @@ class TestCache(unittest.TestCase):
         c.set("a", 1, ttl_s=0)
         self.assertIsNone(c.get("a"))
 
+    def test_frame_cache_memoizes_per_dataframe_and_evicts(self) -> None:
+        import pandas as pd
+
+        from services.cache import FrameCache
+
+        c = FrameCache()
+        df = pd.DataFrame({"a": [1.0, 2.0]})
+        total = float(df["a"].sum())
+        calls: list[int] = []
+
+        # La factory ne reference pas df: seul le local est supprime plus bas.
+        def factory() -> float:
+            calls.append(1)
+            return total
+
+        self.assertEqual(c.get_or_compute(df, "sum", factory), 3.0)
+        self.assertEqual(c.get_or_compute(df, "sum", factory), 3.0)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(c), 1)
+
+        del df
+        self.assertEqual(len(c), 0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -15,9 +15,13 @@ class TestCoreParsingFormatting(unittest.TestCase):
         from core.parsing import parse_km_list
 
         self.assertEqual(parse_km_list(""), [])
+        self.assertEqual(parse_km_list(" , km"), [])
         self.assertEqual(parse_km_list("5"), [5.0])
         self.assertEqual(parse_km_list("5km, 10 km,21.1"), [5.0, 10.0, 21.1])
         self.assertEqual(parse_km_list("-1, 2"), [2.0])
+        self.assertEqual(parse_km_list("abc, 5 KM,,1e1, 5 10"), [5.0, 10.0])
+        self.assertEqual(parse_km_list("km5, KM 7, km 9 km"), [5.0, 7.0, 9.0])
+        self.assertEqual(parse_km_list("1_000, 2km5, 5kmkm, 5 km km, -0.5"), [1000.0, 25.0, 5.0, 5.0])
 
     def test_formatting(self) -> None:
         from core.formatting import format_duration_clock, format_duration_compact, format_time_of_day
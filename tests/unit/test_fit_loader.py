@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import datetime
+import math
+import unittest
+
+from tests.unit._bootstrap import ensure_project_on_path
+
+
+ensure_project_on_path()
+
+
+class _Field:
+    def __init__(self, name, value, units=None) -> None:
+        self.name = name
+        self.value = value
+        self.units = units
+
+
+class _Record:
+    def __init__(self, **values) -> None:
+        self.fields = [
+            _Field(name, value[0], value[1]) if isinstance(value, tuple) else _Field(name, value)
+            for name, value in values.items()
+        ]
+
+    def get_value(self, name):
+        for f in self.fields:
+            if f.name == name:
+                return f.value
+        return None
+
+
+class _FitFile:
+    def __init__(self, records) -> None:
+        self._records = records
+
+    def get_messages(self, name):
+        return iter(self._records if name == "record" else [])
+
+
+def _semicircles(deg: float) -> int:
+    from core.fit_loader import SEMICIRCLE_TO_DEG
+
+    return int(round(deg / SEMICIRCLE_TO_DEG))
+
+
+class TestFitToDataFrame(unittest.TestCase):
+    def test_device_distance_falls_back_to_geo_when_decreasing(self) -> None:
+        from core.fit_loader import fit_to_dataframe
+
+        t0 = datetime.datetime(2024, 5, 1, 8, 0, 0)
+        records = [
+            _Record(
+                position_lat=_semicircles(45.0),
+                position_long=_semicircles(6.0 + i * 0.0001),
+                timestamp=t0 + datetime.timedelta(seconds=2 * i),
+                distance=dist,
+            )
+            for i, dist in enumerate([0.0, 8.0, 2.0, 30.0])
+        ]
+        df = fit_to_dataframe(_FitFile(records))
+
+        self.assertEqual(df["distance_m"].iloc[1], 8.0)
+        # Distance capteur decroissante -> distance geographique cumulee (~7.9 m).
+        self.assertAlmostEqual(df["delta_distance_m"].iloc[2], 7.88, places=1)
+        self.assertAlmostEqual(df["distance_m"].iloc[2], 8.0 + df["delta_distance_m"].iloc[2])
+        self.assertEqual(df["distance_m"].iloc[3], 30.0)
+        self.assertTrue(math.isnan(df["delta_time_s"].iloc[0]))
+        self.assertEqual(df["elapsed_time_s"].tolist(), [0.0, 2.0, 4.0, 6.0])
+        self.assertEqual(df["speed_m_s"].iloc[1], 4.0)
+
+    def test_missing_device_distance_is_filled_from_previous_point(self) -> None:
+        from core.fit_loader import fit_to_dataframe
+
+        records = [
+            _Record(position_lat=_semicircles(45.0), position_long=_semicircles(6.0 + i * 0.0001), distance=dist)
+            for i, dist in enumerate([0.0, 50.0, None, 100.0])
+        ]
+        df = fit_to_dataframe(_FitFile(records))
+
+        self.assertAlmostEqual(df["distance_m"].iloc[2], 50.0 + df["delta_distance_m"].iloc[2])
+        self.assertAlmostEqual(df["delta_distance_m"].iloc[2], 7.88, places=1)
+        self.assertEqual(df["distance_m"].iloc[3], 100.0)
+        self.assertAlmostEqual(df["delta_distance_m"].iloc[3], 100.0 - df["distance_m"].iloc[2])
+
+    def test_running_dynamics_units_are_normalized(self) -> None:
+        from core.fit_loader import fit_to_dataframe
+
+        records = [
+            _Record(
+                stride_length=(120.0, None),
+                vertical_oscillation=(85.0, "mm"),
+                vertical_ratio=(0.08, None),
+                ground_contact_time=(0.25, "s"),
+                ground_contact_time_balance=(49.6, "percent"),
+            ),
+            _Record(
+                enhanced_stride_length=(1.1, "m"),
+                vertical_oscillation=(8.5, None),
+                vertical_ratio=(8.0, "%"),
+                ground_contact_time=(250.0, "ms"),
+            ),
+        ]
+        df = fit_to_dataframe(_FitFile(records))
+
+        self.assertEqual(df["stride_length_m"].tolist(), [1.2, 1.1])
+        self.assertEqual(df["vertical_oscillation_cm"].tolist(), [8.5, 8.5])
+        self.assertEqual(df["vertical_ratio_pct"].tolist(), [8.0, 8.0])
+        self.assertEqual(df["ground_contact_time_ms"].tolist(), [250.0, 250.0])
+        self.assertEqual(df["gct_balance_pct"].iloc[0], 49.6)
+        self.assertTrue(math.isnan(df["gct_balance_pct"].iloc[1]))
+
+    def test_empty_fit_returns_canonical_columns(self) -> None:
+        from core.contracts.activity_df_contract import COLUMNS
+        from core.fit_loader import fit_to_dataframe
+
+        df = fit_to_dataframe(_FitFile([]))
+        self.assertTrue(df.empty)
+        self.assertEqual(tuple(df.columns), COLUMNS)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+import math
+import unittest
+
+import numpy as np
+
+from tests.unit._bootstrap import ensure_project_on_path
+
+
+ensure_project_on_path()
+
+
+class TestRollingPace(unittest.TestCase):
+    def test_window_starts_at_last_covering_point(self) -> None:
+        from core.metrics import _rolling_pace_s_per_km
+
+        dt = np.array([10.0, 10.0, 10.0, 10.0, 0.0, 10.0])
+        dd = np.array([50.0, 40.0, 25.0, 50.0, 0.0, 40.0])
+        pace = _rolling_pace_s_per_km(dt, dd, window_s=20.0)
+
+        self.assertTrue(math.isnan(pace[0]))
+        self.assertAlmostEqual(pace[1], 20.0 / 0.090)
+        self.assertAlmostEqual(pace[2], 20.0 / 0.065)
+        self.assertAlmostEqual(pace[3], 20.0 / 0.075)
+        self.assertAlmostEqual(pace[4], 20.0 / 0.075)
+        self.assertAlmostEqual(pace[5], 20.0 / 0.090)
+
+    def test_fractional_dt_window_boundary(self) -> None:
+        from core.metrics import _rolling_pace_s_per_km
+
+        # 1.0 - 0.1 >= 0.9 en flottant alors que 1.0 - 0.9 < 0.1: la fenetre du
+        # dernier point demarre apres le premier echantillon (0.9 s pour 5 m).
+        pace = _rolling_pace_s_per_km(np.array([0.1, 0.7, 0.2]), np.array([1.0, 3.0, 2.0]), window_s=0.9)
+
+        self.assertTrue(math.isnan(pace[0]))
+        self.assertTrue(math.isnan(pace[1]))
+        self.assertAlmostEqual(pace[2], 0.9 / 0.005)
+
+    def test_empty_input(self) -> None:
+        from core.metrics import _rolling_pace_s_per_km
+
+        self.assertEqual(_rolling_pace_s_per_km(np.array([]), np.array([]), window_s=30.0).size, 0)
+
+
+class TestResample1Hz(unittest.TestCase):
+    def test_matches_pandas_resample_with_limited_ffill(self) -> None:
+        import pandas as pd
+
+        from core.metrics import _resample_series_1hz
+
+        dt = np.array([np.nan, 0.5, 0.5, 0.3, 9.0, 0.2, 1.0, 1.0])
+        values = np.array([100.0, 200.0, 220.0, np.nan, 300.0, 320.0, 280.0, 260.0])
+        mask = np.array([True, True, True, True, True, True, False, True])
+
+        elapsed = np.cumsum(np.where(mask & (dt > 0), dt, 0.0))
+        valid = mask & (dt > 0) & np.isfinite(values)
+        expected = (
+            pd.Series(values[valid], index=pd.to_timedelta(elapsed[valid], unit="s"))
+            .resample("1s")
+            .mean()
+            .ffill(limit=5)
+            .to_numpy()
+        )
+        result = _resample_series_1hz(values, dt, mask)
+
+        np.testing.assert_allclose(result, expected, equal_nan=True)
+        self.assertTrue(np.isnan(result[7]))
+
+    def test_needs_two_valid_points(self) -> None:
+        from core.metrics import _resample_series_1hz
+
+        result = _resample_series_1hz(np.array([1.0, np.nan]), np.array([1.0, 1.0]), np.array([True, True]))
+        self.assertEqual(result.size, 0)
+
+
+class TestNormalizedPower(unittest.TestCase):
+    def test_matches_pandas_rolling_and_skips_windows_with_gaps(self) -> None:
+        import pandas as pd
+
+        from core.metrics import _normalized_power_from_series
+
+        rng = np.random.default_rng(0)
+        values = rng.uniform(100.0, 400.0, 200)
+        values[90:95] = np.nan
+        series = pd.Series(values)
+
+        roll = series.rolling(window=30, min_periods=30).mean().dropna().to_numpy()
+        expected = float(np.mean(roll**4) ** 0.25)
+        self.assertAlmostEqual(_normalized_power_from_series(values), expected, places=9)
+
+    def test_too_short_series_is_nan(self) -> None:
+        from core.metrics import _normalized_power_from_series
+
+        self.assertTrue(math.isnan(_normalized_power_from_series(np.full(29, 200.0))))
+
+
+class TestPowerDurationCurve(unittest.TestCase):
+    def test_peaks_per_duration(self) -> None:
+        from core.metrics import _compute_power_duration_curve_from_series
+
+        values = np.array([100.0, 300.0, 200.0, np.nan, 500.0, 100.0])
+        curve = _compute_power_duration_curve_from_series(values, [1, 2, 3, 10])
+
+        self.assertEqual([p["duration_s"] for p in curve], [1.0, 2.0, 3.0, 10.0])
+        self.assertEqual(curve[0]["power_w"], 500.0)
+        self.assertEqual(curve[1]["power_w"], 300.0)
+        self.assertEqual(curve[2]["power_w"], 200.0)
+        self.assertTrue(math.isnan(curve[3]["power_w"]))
+
+
+class TestLongestPause(unittest.TestCase):
+    def test_sums_consecutive_paused_samples(self) -> None:
+        from core.metrics import compute_longest_pause
+
+        dt = np.array([5.0, 10.0, 20.0, 1.0, 0.0, 15.0, 15.0, np.nan, 40.0])
+        moving = np.array([True, False, False, True, False, False, False, False, False])
+
+        # Sequences 10+20, 15+15 (coupee par dt=0) et 40 (coupee par NaN).
+        self.assertEqual(compute_longest_pause(dt, moving), 40.0)
+        self.assertEqual(compute_longest_pause(dt, np.ones(dt.size, dtype=bool)), 0.0)
+
+
+class TestLinearSlope(unittest.TestCase):
+    def test_matches_polyfit_with_and_without_weights(self) -> None:
+        from core.metrics import _linear_slope
+
+        rng = np.random.default_rng(1)
+        x = np.cumsum(rng.uniform(0.001, 0.01, 500))
+        y = 300.0 + 4.0 * x + rng.normal(0.0, 5.0, 500)
+        w = rng.uniform(0.5, 5.0, 500)
+
+        self.assertAlmostEqual(_linear_slope(x, y), np.polyfit(x, y, 1)[0], places=8)
+        self.assertAlmostEqual(_linear_slope(x, y, w), np.polyfit(x, y, 1, w=w)[0], places=8)
+
+    def test_constant_x_is_nan(self) -> None:
+        from core.metrics import _linear_slope
+
+        self.assertTrue(math.isnan(_linear_slope(np.ones(3), np.array([1.0, 2.0, 3.0]))))
+
+
+class TestZoneTable(unittest.TestCase):
+    def test_bounds_and_zone_order(self) -> None:
+        from core.metrics import HR_ZONES, PACE_ZONES, _build_zone_table, _zone_labels
+
+        ratios = np.array([0.40, 0.50, 0.60, 0.95, 1.29, 2.0, np.nan])
+        weights = np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0])
+
+        hr = _build_zone_table(ratios, weights, HR_ZONES, _zone_labels(tuple(HR_ZONES), "%"))
+        self.assertEqual(hr["time_s"].tolist(), [2.0, 3.0, 0.0, 0.0, 15.0])
+        self.assertAlmostEqual(hr["time_pct"].iloc[0], 2.0 / 21.0 * 100.0)
+        self.assertEqual(hr["range"].tolist(), ["50-60%", "60-70%", "70-80%", "80-90%", ">= 90%"])
+
+        pace = _build_zone_table(ratios, weights, PACE_ZONES, _zone_labels(tuple(PACE_ZONES), "% seuil"))
+        self.assertEqual(pace["zone"].tolist(), ["Z1", "Z2", "Z3", "Z4", "Z5"])
+        self.assertEqual(pace["range"].iloc[0], ">= 129% seuil")
+        self.assertEqual(pace["time_s"].tolist(), [11.0, 0.0, 0.0, 0.0, 10.0])
+
+
+class TestEdwardsTrimp(unittest.TestCase):
+    def test_weights_zone_minutes(self) -> None:
+        from core.metrics import HR_ZONES, _edwards_trimp, _zone_times
+
+        ratios = np.array([0.55, 0.65, 0.75, 0.85, 0.95, 0.30])
+        weights = np.array([60.0, 120.0, 60.0, 30.0, 30.0, 600.0])
+        zone_times = _zone_times(ratios, weights, HR_ZONES)
+
+        self.assertEqual(_edwards_trimp(zone_times[0]), 1 + 4 + 3 + 2 + 2.5)
+        self.assertIsNone(_zone_times(ratios, np.zeros(ratios.size), HR_ZONES))
+
+
+class TestCenteredRollingMedian(unittest.TestCase):
+    def test_matches_pandas_rolling_median(self) -> None:
+        import pandas as pd
+
+        from core.metrics import _centered_rolling_median
+
+        values = np.array([np.nan, 3.0, 1.0, np.nan, 8.0, 2.0, 9.0, np.nan, np.nan, np.nan, np.nan, 4.0])
+        expected = pd.Series(values).rolling(window=5, center=True, min_periods=1).median().to_numpy()
+
+        np.testing.assert_array_equal(_centered_rolling_median(values, window=5), expected)
+        self.assertEqual(_centered_rolling_median(np.array([]), window=5).size, 0)
+
+
+class TestFormatZoneTable(unittest.TestCase):
+    def test_labels_match_scalar_formatting(self) -> None:
+        import pandas as pd
+
+        from core.metrics import format_zone_table
+
+        df = pd.DataFrame(
+            {
+                "zone": ["Z1", "Z2", "Z3"],
+                "range": ["a", "b", "c"],
+                "time_s": [59.5, 3725.2, np.nan],
+                "time_pct": [12.25, 87.75, np.nan],
+            }
+        )
+        formatted = format_zone_table(df)
+
+        self.assertEqual(list(formatted.columns), ["Zone", "Plage", "Temps", "% Temps"])
+        self.assertEqual(formatted["Temps"].tolist(), ["1:00", "62:05", "-"])
+        self.assertEqual(formatted["% Temps"].tolist(), [f"{12.25:.1f}%", f"{87.75:.1f}%", "-"])
+
+
+class TestGarminLikeStats(unittest.TestCase):
+    def test_reuses_precomputed_basic_stats(self) -> None:
+        import pandas as pd
+
+        from core.metrics import compute_garmin_like_stats
+        from core.stats.basic_stats import compute_basic_stats
+
+        df = pd.DataFrame(
+            {
+                "distance_m": [0.0, 500.0, 1000.0],
+                "delta_time_s": [np.nan, 150.0, 150.0],
+                "delta_distance_m": [np.nan, 500.0, 500.0],
+                "elapsed_time_s": [0.0, 150.0, 300.0],
+            }
+        )
+        moving_mask = pd.Series([True, True, True])
+        stats = compute_basic_stats(df)
+
+        with_stats = compute_garmin_like_stats(df, moving_mask, basic_stats=stats)
+        without = compute_garmin_like_stats(df, moving_mask)
+
+        self.assertEqual(with_stats["summary"]["total_time_s"], 300.0)
+        self.assertEqual(with_stats["summary"]["distance_km"], 1.0)
+        self.assertEqual(with_stats["summary"], without["summary"])
+
+    def test_no_moving_time_keeps_sensor_maxima(self) -> None:
+        import pandas as pd
+
+        from core.metrics import compute_garmin_like_stats
+
+        df = pd.DataFrame(
+            {
+                "distance_m": [0.0, 2.0],
+                "delta_time_s": [np.nan, 30.0],
+                "delta_distance_m": [np.nan, 2.0],
+                "elapsed_time_s": [0.0, 30.0],
+                "heart_rate": [120.0, 125.0],
+                "power": [150.0, 160.0],
+            }
+        )
+        stats = compute_garmin_like_stats(df, pd.Series([False, False]))
+
+        # Les moyennes ponderees sont vides, les maxima observes restent renseignes.
+        self.assertTrue(math.isnan(stats["heart_rate"]["mean_bpm"]))
+        self.assertEqual(stats["power"]["max_w"], 160.0)
+        self.assertEqual(stats["summary"]["moving_time_s"], 0.0)
+        self.assertEqual(stats["summary"]["pause_time_s"], 30.0)
+        self.assertEqual(stats["summary"]["longest_pause_s"], 30.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
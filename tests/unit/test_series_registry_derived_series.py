@@ -48,3 +48,17 @@ def test_series_registry_moving_uses_core_and_is_numeric() -> None:
     assert len(out.y) == len(df)
     # Pydantic schema expects List[float]; bools should serialize as 0/1.
     assert out.y == [float(v) for v in expected.to_numpy().tolist()]
+
+
+def test_series_registry_available_series_is_memoized_per_dataframe() -> None:
+    df = _make_df()
+    registry = SeriesRegistry()
+
+    first = registry.get_available_series(df)
+    second = registry.get_available_series(df)
+    assert [s.name for s in first] == [s.name for s in second]
+    assert "heart_rate" not in [s.name for s in first]
+    assert len(registry._available_cache) == 1
+
+    del df
+    assert registry._available_cache == {}